@@ -0,0 +1,489 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from typing import TYPE_CHECKING, Optional
+
+from ape.logging import logger
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from ape_etherscan.cache import source_code_cache
+from ape_etherscan.client import (
+    MAX_CONTRACT_CREATION_ADDRESSES,
+    MAX_RESULT_WINDOW,
+    _BaseAPIClient,
+    _get_source_code_data,
+    _ResultWindow,
+    _to_creation_data,
+    _to_source_code_response,
+    _to_transactions,
+    get_client_factory,
+)
+from ape_etherscan.exceptions import ApeEtherscanException
+from ape_etherscan.rate_limit import api_key_pool, get_rate_limiter
+from ape_etherscan.retry import Deadline, RetryPolicy, is_rate_limited
+from ape_etherscan.types import (
+    ContractCreationResponse,
+    EtherscanInstance,
+    EtherscanResponse,
+    EtherscanTransaction,
+    SourceCodeResponse,
+)
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse, ClientSession, ClientTimeout
+
+    from ape_etherscan.config import EcosystemConfig, EtherscanConfig
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError as err:
+        raise ApeEtherscanException(
+            "The async clients require 'aiohttp'. "
+            "Install it using `pip install 'ape-etherscan[async]'`."
+        ) from err
+
+    return aiohttp
+
+
+def _create_session() -> "ClientSession":
+    return _import_aiohttp().ClientSession()
+
+
+def _to_client_timeout(config: "EcosystemConfig", deadline: Deadline) -> "ClientTimeout":
+    # NOTE: aiohttp treats a `total` of 0 as no timeout at all.
+    return _import_aiohttp().ClientTimeout(
+        total=None if deadline.timeout is None else deadline.clamp(deadline.timeout),
+        sock_connect=config.connect_timeout,
+        sock_read=config.read_timeout,
+    )
+
+
+def _to_query(params: Optional[dict]) -> Optional[list[tuple[str, str]]]:
+    # NOTE: Encode params the way `requests` does: skip `None`,
+    #   repeat the key for each item of a list.
+    if params is None:
+        return None
+
+    query = []
+    for key, value in params.items():
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            if item is not None:
+                query.append((key, item if isinstance(item, str) else str(item)))
+
+    return query
+
+
+def _to_response(response: "ClientResponse", content: bytes) -> Response:
+    # NOTE: Build a `requests.Response` so the response handling
+    #   (and errors) are the same as for the synchronous clients.
+    result = Response()
+    result.status_code = response.status
+    result.headers = CaseInsensitiveDict(response.headers)
+    result._content = content
+    result.encoding = response.charset or "utf-8"
+    result.reason = response.reason or ""
+    result.url = str(response.url)
+    return result
+
+
+class _AsyncRetryPolicy(RetryPolicy):
+    """
+    A :class:`~ape_etherscan.retry.RetryPolicy` for the errors of ``aiohttp``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # NOTE: aiohttp's errors are `ClientError`s, `OSError`s, or timeouts.
+        kwargs.setdefault(
+            "retry_errors", (_import_aiohttp().ClientError, OSError, asyncio.TimeoutError)
+        )
+        super().__init__(*args, **kwargs)
+
+    def is_connect_error(self, err: Exception) -> bool:
+        aiohttp = _import_aiohttp()
+        return isinstance(err, (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError))
+
+
+class _AsyncAPIClient(_BaseAPIClient):
+    _retry_policy_class = _AsyncRetryPolicy
+
+    def __init__(
+        self,
+        instance: EtherscanInstance,
+        module_name: str,
+        session: Optional["ClientSession"] = None,
+    ):
+        self._session = session
+        super().__init__(instance, module_name)
+
+    @property
+    def session(self) -> "ClientSession":
+        """
+        The ``aiohttp`` session to send requests with.
+        """
+        if self._session is None:
+            self._session = _create_session()
+
+        return self._session
+
+    async def _get(
+        self,
+        params: Optional[dict] = None,
+        headers: Optional[dict[str, str]] = None,
+        raise_on_exceptions: bool = True,
+        deadline: Optional[Deadline] = None,
+    ) -> EtherscanResponse:
+        return await self._request(
+            "GET",
+            params=params,
+            headers=headers,
+            raise_on_exceptions=raise_on_exceptions,
+            deadline=deadline,
+        )
+
+    async def _post(
+        self, json_dict: Optional[dict] = None, headers: Optional[dict[str, str]] = None
+    ) -> EtherscanResponse:
+        return await self._request("POST", data=json_dict, headers=headers)
+
+    async def _request(
+        self,
+        method: str,
+        raise_on_exceptions: bool = True,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> EtherscanResponse:
+        headers = headers or self.DEFAULT_HEADERS
+        if not self._retries:
+            raise ValueError(f"Retries must be at least 1: {self._retries}")
+
+        deadline = deadline or Deadline()
+        policy = self.retry_policy
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            request_params, request_data, api_key = self._authorize_request(method, params, data)
+            await get_rate_limiter(api_key, self._host, self._rate_limit).acquire_async()
+            deadline.check()
+            logger.debug(f"Request sent to {self._clean_uri}.")
+            try:
+                async with self.session.request(
+                    method.upper(),
+                    self.base_uri,
+                    headers=headers,
+                    params=_to_query(request_params),
+                    data=request_data,
+                    timeout=_to_client_timeout(self._config, deadline),
+                ) as client_response:
+                    response = _to_response(client_response, await client_response.read())
+
+            except policy.retry_errors as err:
+                time_to_sleep = policy.get_error_delay(err, attempt, started, method, deadline)
+                if time_to_sleep is None:
+                    raise
+
+                logger.debug(f"Request failed ({err}). Retrying in {time_to_sleep:.2f} seconds.")
+                await asyncio.sleep(time_to_sleep)
+                attempt += 1
+                continue
+
+            if api_key and is_rate_limited(response):
+                api_key_pool.quarantine(api_key)
+
+            if policy.is_retryable(response, method):
+                time_to_sleep = policy.get_delay(attempt, started, response, deadline=deadline)
+                if time_to_sleep is not None:
+                    logger.debug(
+                        f"Request was throttled or failed ({response.status_code}). "
+                        f"Retrying in {time_to_sleep:.2f} seconds."
+                    )
+                    await asyncio.sleep(time_to_sleep)
+                    attempt += 1
+                    continue
+
+            return self._handle_response(response, raise_on_exceptions)
+
+
+class AsyncContractClient(_AsyncAPIClient):
+    """
+    The asynchronous version of :class:`~ape_etherscan.client.ContractClient`.
+    """
+
+    def __init__(
+        self,
+        instance: EtherscanInstance,
+        address: str,
+        session: Optional["ClientSession"] = None,
+    ):
+        self._address = address
+        super().__init__(instance, "contract", session=session)
+
+    async def get_source_code(self) -> SourceCodeResponse:
+        # NOTE: Only cache results when the chain is known.
+        chain_id = self._instance.chain_id if self._config.cache_source_code else None
+        result = None
+        data = None
+        if chain_id is not None:
+            # NOTE: Reading (and parsing) the cache file can take a while;
+            #   keep it off the event loop.
+            data = await asyncio.to_thread(source_code_cache.get, chain_id, self._address)
+
+        if data is None:
+            params = {
+                **self.base_params,
+                "action": "getsourcecode",
+                "address": self._address,
+            }
+            result = await self._get(params=params)
+            if (data := _get_source_code_data(result)) is None:
+                return SourceCodeResponse()
+
+            elif chain_id is not None:
+                await asyncio.to_thread(source_code_cache.set, chain_id, self._address, data)
+
+        return _to_source_code_response(data, result, self._address)
+
+    async def check_verify_status(self, guid: str) -> str:
+        json_dict = {**self.base_params, "action": "checkverifystatus", "guid": guid}
+        response = await self._get(params=json_dict, raise_on_exceptions=False)
+        return str(response.value)
+
+    async def get_creation_data(
+        self, other_addresses: Optional[list[str]] = None
+    ) -> list[ContractCreationResponse]:
+        """
+        Get the creation data of the contract.
+
+        Args:
+            other_addresses (list[str] | None): More contracts to look up in the same
+              request. Etherscan accepts up to
+              :data:`~ape_etherscan.client.MAX_CONTRACT_CREATION_ADDRESSES` in total.
+
+        Returns:
+            list[:class:`~ape_etherscan.types.ContractCreationResponse`]
+        """
+        addresses = [self._address, *(other_addresses or [])]
+        params = {
+            **self.base_params,
+            "action": "getcontractcreation",
+            "contractaddresses": [",".join(addresses)],
+        }
+        return _to_creation_data(await self._get(params=params))
+
+
+class AsyncAccountClient(_AsyncAPIClient):
+    """
+    The asynchronous version of :class:`~ape_etherscan.client.AccountClient`.
+    """
+
+    def __init__(
+        self,
+        instance: EtherscanInstance,
+        address: str,
+        session: Optional["ClientSession"] = None,
+    ):
+        self._address = address
+        super().__init__(instance, "account", session=session)
+
+    async def get_all_normal_transactions(
+        self,
+        start_block: Optional[int] = None,
+        end_block: Optional[int] = None,
+        offset: int = 100,
+        sort: str = "asc",
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[EtherscanTransaction]:
+        """
+        Get all the normal transactions for the account. Once a block range fills
+        Etherscan's 10,000-result window, the rest of the range is queried next.
+        Unlike the synchronous client, transactions are never stored locally.
+
+        Args:
+            start_block (int | None): The first block to include.
+            end_block (int | None): The last block to include.
+            offset (int): The number of transactions per page. Defaults to ``100``.
+            sort (str): ``"asc"`` or ``"desc"``. Defaults to ``"asc"``.
+            concurrency (int | None): The number of pages to keep in flight at once.
+              Defaults to the ecosystem's configured ``concurrency``.
+            timeout (float | None): The most seconds to spend requesting transactions,
+              counted from the first request. Defaults to no limit.
+
+        Raises:
+            :class:`~ape_etherscan.exceptions.EtherscanTimeoutError`: When the
+              transactions are not all received in time.
+
+        Returns:
+            AsyncIterator[:class:`~ape_etherscan.types.EtherscanTransaction`]
+        """
+        concurrency = self._config.concurrency if concurrency is None else concurrency
+        deadline = Deadline(timeout)
+        skip: frozenset[str] = frozenset()
+        while True:
+            window = _ResultWindow(offset, skip)
+            async for page in self._get_pages_of_normal_transactions(
+                start_block, end_block, offset, sort, concurrency, deadline
+            ):
+                for tx in window.filter(page):
+                    yield tx
+
+            if not (
+                next_range := window.get_next_range(start_block, end_block, sort, self._address)
+            ):
+                return
+
+            start_block, end_block, skip = next_range
+
+    async def _get_pages_of_normal_transactions(
+        self,
+        start_block: Optional[int],
+        end_block: Optional[int],
+        offset: int,
+        sort: str,
+        concurrency: int,
+        deadline: Deadline,
+    ) -> AsyncIterator[list[EtherscanTransaction]]:
+        last_page_num = max(MAX_RESULT_WINDOW // offset, 1)
+        page = await self._get_page_of_normal_transactions(
+            1, start_block, end_block, offset, sort, deadline
+        )
+        if page:
+            yield page
+
+        if len(page) < offset:
+            return
+
+        tasks: deque[asyncio.Task] = deque()
+        next_page_num = 2
+        try:
+            while True:
+                while len(tasks) < max(concurrency, 1) and next_page_num <= last_page_num:
+                    coroutine = self._get_page_of_normal_transactions(
+                        next_page_num, start_block, end_block, offset, sort, deadline
+                    )
+                    tasks.append(asyncio.ensure_future(coroutine))
+                    next_page_num += 1
+
+                if not tasks:
+                    return
+
+                page = await tasks.popleft()
+                if page:
+                    yield page
+
+                if len(page) < offset:
+                    # No more items. Stop now to avoid 500 errors.
+                    return
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _get_page_of_normal_transactions(
+        self,
+        page: int,
+        start_block: Optional[int] = None,
+        end_block: Optional[int] = None,
+        offset: int = 100,
+        sort: str = "asc",
+        deadline: Optional[Deadline] = None,
+    ) -> list[EtherscanTransaction]:
+        params = {
+            **self.base_params,
+            "action": "txlist",
+            "address": self._address,
+            "startblock": start_block,
+            "endblock": end_block,
+            "page": page,
+            "offset": offset,
+            "sort": sort,
+        }
+        return _to_transactions(await self._get(params=params, deadline=deadline))
+
+
+class AsyncClientFactory:
+    """
+    Creates asynchronous clients that share one ``aiohttp`` session.
+    Use it as an async context manager (or call :meth:`close`) to close
+    the session when done.
+    """
+
+    def __init__(self, instance: EtherscanInstance, session: Optional["ClientSession"] = None):
+        self._instance = instance
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self) -> "AsyncClientFactory":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    @property
+    def session(self) -> "ClientSession":
+        if self._session is None:
+            self._session = _create_session()
+
+        return self._session
+
+    def get_contract_client(self, contract_address: str) -> AsyncContractClient:
+        return AsyncContractClient(self._instance, contract_address, session=self.session)
+
+    def get_account_client(self, account_address: str) -> AsyncAccountClient:
+        return AsyncAccountClient(self._instance, account_address, session=self.session)
+
+    async def get_creation_data(
+        self, contract_addresses: Iterable[str]
+    ) -> dict[str, Optional[ContractCreationResponse]]:
+        """
+        Get the creation data of many contracts, sending up to
+        :data:`~ape_etherscan.client.MAX_CONTRACT_CREATION_ADDRESSES` per request.
+
+        Args:
+            contract_addresses (Iterable[str]): The contracts.
+
+        Returns:
+            dict[str, :class:`~ape_etherscan.types.ContractCreationResponse` | None]:
+            The creation data of each contract, or None when Etherscan has none.
+        """
+        addresses = list(dict.fromkeys(contract_addresses))
+        size = MAX_CONTRACT_CREATION_ADDRESSES
+        batches = [addresses[start:][:size] for start in range(0, len(addresses), size)]
+        responses = await asyncio.gather(
+            *(
+                self.get_contract_client(batch[0]).get_creation_data(other_addresses=batch[1:])
+                for batch in batches
+            )
+        )
+        results: dict[str, Optional[ContractCreationResponse]] = {a: None for a in addresses}
+        by_lower = {a.lower(): a for a in addresses}
+        for creation_data_list in responses:
+            for creation_data in creation_data_list:
+                if address := by_lower.get(creation_data.contractAddress.lower()):
+                    results[address] = creation_data
+
+        return results
+
+    async def close(self):
+        """
+        Close the session, if the factory created it.
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def get_async_client_factory(
+    etherscan_config: "EtherscanConfig", ecosystem_name: str, network_name: str, chain_id: int
+) -> AsyncClientFactory:
+    """
+    Get an asynchronous client factory for a network.
+    """
+    # NOTE: Reuse the (memoized) synchronous factory's resolved explorer URIs.
+    factory = get_client_factory(etherscan_config, ecosystem_name, network_name, chain_id)
+    return AsyncClientFactory(factory._instance)
@@ -0,0 +1,539 @@
+import json
+import shutil
+import sqlite3
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from contextlib import closing
+from itertools import islice
+from pathlib import Path
+from typing import Optional
+
+import requests
+from ape.logging import logger
+from ape.utils import USER_AGENT, ManagerAccessMixin
+
+from ape_etherscan.types import SupportedChain
+from ape_etherscan.utils import parse_json
+
+CHAINLIST_URL = "https://api.etherscan.io/v2/chainlist"
+BUNDLED_CHAINLIST_PATH = Path(__file__).parent / "chainlist.json"
+
+# Seconds to wait before trying again after a failed chainlist refresh.
+_CHAINLIST_RETRY_INTERVAL = 60
+
+# Seconds a lookup of a chain missing from the chainlist waits for a refresh.
+_CHAINLIST_MISS_TIMEOUT = 2
+
+# Number of transactions written to the store per commit.
+_TRANSACTION_BATCH_SIZE = 1000
+
+# The ``ABI`` Etherscan returns for contracts that are not verified.
+UNVERIFIED_ABI = "Contract source code not verified"
+
+
+class ChainlistCache(ManagerAccessMixin):
+    """
+    A persistent cache of the chains Etherscan supports.
+    The chainlist is stored in the ape data folder and served from there,
+    so resolving explorer URIs does not block on the network. Once the cache
+    is older than the configured ``chainlist_ttl``, the stale list keeps being
+    served while a fresh one is downloaded in the background. When there is no
+    cache yet (and no network), the snapshot bundled with the plugin is used.
+    """
+
+    def __init__(self):
+        self._chains: Optional[list[dict]] = None
+        self._index: dict[int, SupportedChain] = {}
+        self._expires_at = 0.0
+        self._refreshed_on_miss = False
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @property
+    def path(self) -> Path:
+        """
+        The location of the cached chainlist.
+        """
+        return self.config_manager.DATA_FOLDER / "etherscan" / "chainlist.json"
+
+    @property
+    def ttl(self) -> int:
+        """
+        The number of seconds a downloaded chainlist is considered fresh.
+        """
+        return self.config_manager.get_config("etherscan").chainlist_ttl
+
+    @property
+    def is_stale(self) -> bool:
+        return time.time() >= self._expires_at
+
+    def get(self) -> list[dict]:
+        """
+        Get the chainlist, loading it from disk (or the bundled snapshot)
+        the first time and refreshing it in the background when stale.
+
+        Returns:
+            list[dict]
+        """
+        if self._chains is None:
+            with self._lock:
+                if self._chains is None:
+                    self._load()
+
+        if self.is_stale:
+            self._refresh_in_background()
+
+        return self._chains or []
+
+    def get_chain(self, chain_id: int) -> Optional[SupportedChain]:
+        """
+        Look up a chain by its ID.
+
+        Args:
+            chain_id (int): The chain ID.
+
+        Returns:
+            :class:`~ape_etherscan.types.SupportedChain` | None: None when
+            Etherscan does not support the chain.
+        """
+        self.get()  # Ensure loaded.
+        if chain := self._index.get(chain_id):
+            return chain
+
+        elif not self._refreshed_on_miss:
+            # The chain may be newer than the cached (or bundled) chainlist.
+            # Only try this once per process, and only wait briefly (joining
+            # the refresh already running, if any), so unsupported chains
+            # (such as local ones) stay cheap and offline lookups do not hang.
+            self._refreshed_on_miss = True
+            self._refresh_in_background().join(_CHAINLIST_MISS_TIMEOUT)
+            return self._index.get(chain_id)
+
+        return None
+
+    def refresh(self) -> bool:
+        """
+        Download the chainlist from Etherscan and write it to the cache.
+
+        Returns:
+            bool: ``True`` when the chainlist was refreshed.
+        """
+        try:
+            response = requests.get(
+                CHAINLIST_URL, headers={"User-Agent": USER_AGENT}, timeout=(5, 30)
+            )
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError) as err:
+            logger.debug(f"Unable to refresh Etherscan chainlist: {err}")
+            # Serve what we have and try again later.
+            self._expires_at = time.time() + _CHAINLIST_RETRY_INTERVAL
+            return False
+
+        if not (chains := data.get("result")):
+            self._expires_at = time.time() + _CHAINLIST_RETRY_INTERVAL
+            return False
+
+        self._write(data)
+        with self._lock:
+            self._set_chains(chains)
+            self._expires_at = time.time() + self.ttl
+
+        return True
+
+    def clear(self):
+        """
+        Forget the loaded chainlist and delete the cache file.
+        """
+        with self._lock:
+            self._chains = None
+            self._index = {}
+            self._expires_at = 0.0
+            self.path.unlink(missing_ok=True)
+
+    def _load(self):
+        if self.path.is_file():
+            try:
+                data = parse_json(self.path.read_bytes())
+            except (OSError, ValueError) as err:
+                logger.debug(f"Ignoring corrupt Etherscan chainlist cache: {err}")
+            else:
+                if chains := data.get("result"):
+                    self._set_chains(chains)
+                    self._expires_at = self.path.stat().st_mtime + self.ttl
+                    return
+
+        # NOTE: The bundled snapshot is always considered stale so that
+        #   it gets replaced by a downloaded chainlist as soon as possible.
+        data = json.loads(BUNDLED_CHAINLIST_PATH.read_text())
+        self._set_chains(data.get("result", []))
+        self._expires_at = 0.0
+
+    def _set_chains(self, chains: list[dict]):
+        index = {}
+        for data in chains:
+            try:
+                chain = SupportedChain.from_chainlist_entry(data)
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            index[chain.chain_id] = chain
+
+        # NOTE: Swap the index before the list; readers check the list first.
+        self._index = index
+        self._chains = chains
+
+    def _write(self, data: dict):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data))
+            tmp_path.replace(self.path)
+        except OSError as err:
+            logger.debug(f"Unable to cache Etherscan chainlist: {err}")
+
+    def _refresh_in_background(self) -> threading.Thread:
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return self._refresh_thread
+
+            self._refresh_thread = threading.Thread(
+                target=self.refresh, name="etherscan-chainlist", daemon=True
+            )
+            self._refresh_thread.start()
+            return self._refresh_thread
+
+
+chainlist_cache = ChainlistCache()
+
+
+class NonceIndex:
+    """
+    The blocks of the account transactions seen so far, by nonce.
+    An account's transactions are mined in nonce order, so known nonces bound
+    the blocks any other nonce can be in. This lets account-history queries
+    skip the blocks that cannot have the requested nonces.
+    """
+
+    def __init__(self):
+        # (chain_id, account) -> (sorted nonces, blocks)
+        self._index: dict[tuple[Optional[int], str], tuple[list[int], list[int]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, chain_id: Optional[int], account: str, nonce: int, block: int):
+        """
+        Record the block of an account's transaction.
+
+        Args:
+            chain_id (int | None): The chain ID.
+            account (str): The sender.
+            nonce (int): The transaction nonce.
+            block (int): The block the transaction was mined in.
+        """
+        with self._lock:
+            nonces, blocks = self._index.setdefault((chain_id, account), ([], []))
+            idx = bisect_left(nonces, nonce)
+            if idx < len(nonces) and nonces[idx] == nonce:
+                blocks[idx] = block
+            else:
+                nonces.insert(idx, nonce)
+                blocks.insert(idx, block)
+
+    def get_block_range(
+        self, chain_id: Optional[int], account: str, start_nonce: int, stop_nonce: int
+    ) -> tuple[Optional[int], Optional[int]]:
+        """
+        Get the range of blocks the transactions with the given nonces must be in.
+
+        Args:
+            chain_id (int | None): The chain ID.
+            account (str): The sender.
+            start_nonce (int): The first nonce.
+            stop_nonce (int): The last nonce.
+
+        Returns:
+            tuple[int | None, int | None]: The first and last block, or None
+            where no bound is known.
+        """
+        if not (entry := self._index.get((chain_id, account))):
+            return None, None
+
+        nonces, blocks = entry
+        with self._lock:
+            # The block of the closest known nonce at or before the start.
+            start_idx = bisect_right(nonces, start_nonce) - 1
+            start_block = blocks[start_idx] if start_idx >= 0 else None
+            # The block of the closest known nonce at or after the stop.
+            stop_idx = bisect_left(nonces, stop_nonce)
+            end_block = blocks[stop_idx] if stop_idx < len(nonces) else None
+
+        return start_block, end_block
+
+    def clear(self):
+        with self._lock:
+            self._index = {}
+
+
+nonce_index = NonceIndex()
+
+
+class TransactionCache(ManagerAccessMixin):
+    """
+    A local SQLite store of the raw Etherscan transactions of accounts.
+    Along with the transactions, it keeps the last block synced for each
+    account, so only newer blocks need to be requested from Etherscan.
+    """
+
+    def __init__(self):
+        self._initialized: set[Path] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """
+        The location of the database.
+        """
+        return self.config_manager.DATA_FOLDER / "etherscan" / "transactions.db"
+
+    def get_last_block(self, chain_id: int, address: str) -> Optional[int]:
+        """
+        Get the last block synced for an account.
+
+        Args:
+            chain_id (int): The chain ID.
+            address (str): The account.
+
+        Returns:
+            int | None: None when the account was never synced.
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT last_block FROM sync_state WHERE chain_id = ? AND address = ?",
+                (chain_id, address.lower()),
+            ).fetchone()
+
+        return None if row is None else row[0]
+
+    def add(self, chain_id: int, address: str, transactions: Iterable[dict]):
+        """
+        Store an account's transactions, in ascending block order, and move
+        its last synced block forward as they are written.
+
+        Args:
+            chain_id (int): The chain ID.
+            address (str): The account.
+            transactions (Iterable[dict]): The raw Etherscan transactions.
+        """
+        address = address.lower()
+        transactions = iter(transactions)
+        last_block = None
+        with closing(self._connect()) as connection:
+            while batch := list(islice(transactions, _TRANSACTION_BATCH_SIZE)):
+                rows = [
+                    (
+                        chain_id,
+                        address,
+                        tx["hash"],
+                        int(tx["blockNumber"]),
+                        int(tx.get("transactionIndex") or 0),
+                        json.dumps(tx),
+                    )
+                    for tx in batch
+                ]
+                last_block = rows[-1][3]
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?)", rows
+                    )
+                    # NOTE: The next batch may have more transactions from the last block,
+                    #   so only the blocks before it are known to be complete.
+                    self._set_last_block(connection, chain_id, address, last_block - 1)
+
+            if last_block is not None:
+                with connection:
+                    self._set_last_block(connection, chain_id, address, last_block)
+
+    def get_transactions(
+        self,
+        chain_id: int,
+        address: str,
+        start_block: Optional[int] = None,
+        end_block: Optional[int] = None,
+        sort: str = "asc",
+    ) -> Iterator[dict]:
+        """
+        Get the stored transactions of an account.
+
+        Args:
+            chain_id (int): The chain ID.
+            address (str): The account.
+            start_block (int | None): The first block to include.
+            end_block (int | None): The last block to include.
+            sort (str): ``"asc"`` or ``"desc"``. Defaults to ``"asc"``.
+
+        Returns:
+            Iterator[dict]
+        """
+        order = "DESC" if sort == "desc" else "ASC"
+        query = (
+            "SELECT data FROM transactions "
+            "WHERE chain_id = ? AND address = ? AND block BETWEEN ? AND ? "
+            f"ORDER BY block {order}, tx_index {order}"
+        )
+        params = (
+            chain_id,
+            address.lower(),
+            0 if start_block is None else start_block,
+            # NOTE: SQLite integers are 64-bit signed.
+            2**63 - 1 if end_block is None else end_block,
+        )
+        with closing(self._connect()) as connection:
+            for (data,) in connection.execute(query, params):
+                yield parse_json(data)
+
+    def clear(self):
+        """
+        Delete the database.
+        """
+        with self._lock:
+            self._initialized.discard(self.path)
+            self.path.unlink(missing_ok=True)
+
+    def _connect(self) -> sqlite3.Connection:
+        path = self.path
+        if path not in self._initialized:
+            with self._lock:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with closing(sqlite3.connect(path)) as connection, connection:
+                    connection.executescript(
+                        """
+                        CREATE TABLE IF NOT EXISTS transactions (
+                            chain_id INTEGER NOT NULL,
+                            address TEXT NOT NULL,
+                            hash TEXT NOT NULL,
+                            block INTEGER NOT NULL,
+                            tx_index INTEGER NOT NULL,
+                            data TEXT NOT NULL,
+                            PRIMARY KEY (chain_id, address, hash)
+                        );
+                        CREATE INDEX IF NOT EXISTS transactions_by_block
+                            ON transactions (chain_id, address, block, tx_index);
+                        CREATE TABLE IF NOT EXISTS sync_state (
+                            chain_id INTEGER NOT NULL,
+                            address TEXT NOT NULL,
+                            last_block INTEGER NOT NULL,
+                            PRIMARY KEY (chain_id, address)
+                        );
+                        """
+                    )
+
+                self._initialized.add(path)
+
+        return sqlite3.connect(path)
+
+    @staticmethod
+    def _set_last_block(
+        connection: sqlite3.Connection, chain_id: int, address: str, last_block: int
+    ):
+        connection.execute(
+            "INSERT INTO sync_state VALUES (?, ?, ?) "
+            "ON CONFLICT (chain_id, address) DO UPDATE SET last_block = "
+            "MAX(last_block, excluded.last_block)",
+            (chain_id, address, last_block),
+        )
+
+
+transaction_cache = TransactionCache()
+
+
+class SourceCodeCache(ManagerAccessMixin):
+    """
+    A persistent cache of Etherscan ``getsourcecode`` results, by chain and address.
+    Verified source code does not change, so it is kept until cleared, except for
+    proxies, which may be upgraded to a new implementation and are refreshed after
+    ``source_code_proxy_ttl``. Contracts that are not verified (yet) are only
+    remembered for ``source_code_unverified_ttl``.
+    """
+
+    @property
+    def path(self) -> Path:
+        """
+        The directory of the cached results.
+        """
+        return self.config_manager.DATA_FOLDER / "etherscan" / "source_code"
+
+    def get(self, chain_id: int, address: str) -> Optional[dict]:
+        """
+        Get the cached result for a contract.
+
+        Args:
+            chain_id (int): The chain ID.
+            address (str): The contract address.
+
+        Returns:
+            dict | None: The raw ``getsourcecode`` result, or None when missing
+            or expired.
+        """
+        path = self._get_path(chain_id, address)
+        try:
+            entry = parse_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            logger.debug(f"Ignoring corrupt Etherscan source code cache '{path}': {err}")
+            return None
+
+        if (expires_at := entry.get("expires_at")) is not None and time.time() >= expires_at:
+            return None
+
+        return entry.get("data")
+
+    def set(self, chain_id: int, address: str, data: dict):
+        """
+        Cache the result for a contract.
+
+        Args:
+            chain_id (int): The chain ID.
+            address (str): The contract address.
+            data (dict): The raw ``getsourcecode`` result.
+        """
+        config = self.config_manager.get_config("etherscan")
+        if data.get("ABI") == UNVERIFIED_ABI:
+            expires_at = time.time() + config.source_code_unverified_ttl
+        elif str(data.get("Proxy", "0")) == "1":
+            expires_at = time.time() + config.source_code_proxy_ttl
+        else:
+            expires_at = None
+
+        path = self._get_path(chain_id, address)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps({"expires_at": expires_at, "data": data}))
+            tmp_path.replace(path)
+        except OSError as err:
+            logger.debug(f"Unable to cache Etherscan source code: {err}")
+
+    def delete(self, chain_id: int, address: str):
+        """
+        Delete the cached result for a contract, such as once it is verified.
+
+        Args:
+            chain_id (int): The chain ID.
+            address (str): The contract address.
+        """
+        self._get_path(chain_id, address).unlink(missing_ok=True)
+
+    def clear(self):
+        """
+        Delete all cached results.
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _get_path(self, chain_id: int, address: str) -> Path:
+        return self.path / str(chain_id) / f"{address.lower()}.json"
+
+
+source_code_cache = SourceCodeCache()
@@ -1,37 +1,61 @@
 import json
-import os
-import random
+import threading
 import time
-from collections.abc import Iterator
-from functools import lru_cache
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import StringIO
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-import requests
 from ape.logging import logger
-from ape.utils import USER_AGENT, ManagerAccessMixin
-from requests import Session
+from ape.utils import USER_AGENT, ManagerAccessMixin, cached_property
+from requests import Response, Session
 from yarl import URL
 
+from ape_etherscan.cache import (
+    UNVERIFIED_ABI,
+    chainlist_cache,
+    source_code_cache,
+    transaction_cache,
+)
+from ape_etherscan.config import EcosystemConfig
 from ape_etherscan.exceptions import (
     ContractNotVerifiedError,
+    EtherscanTooManyRequestsError,
     IncompatibleCompilerSettingsError,
     UnhandledResultError,
     UnsupportedEcosystemError,
 )
+from ape_etherscan.rate_limit import api_key_pool, get_rate_limiter
+from ape_etherscan.retry import Deadline, RetryPolicy, is_rate_limited
+from ape_etherscan.session import session_pool
 from ape_etherscan.types import (
     ContractCreationResponse,
     EtherscanInstance,
     EtherscanResponse,
+    EtherscanTransaction,
     SourceCodeResponse,
+    SupportedChain,
 )
-from ape_etherscan.utils import ETHERSCAN_API_KEY_NAME
 
 if TYPE_CHECKING:
+    import numpy as np
     from ape.api import PluginConfig
 
     from ape_etherscan.config import EtherscanConfig
 
+# Etherscan only serves the first 10,000 results of a paginated query.
+MAX_RESULT_WINDOW = 10_000
+
+# Seconds to share a contract's source code between lookups.
+_SOURCE_CODE_MEMO_TTL = 30
+
+# The number of contracts Etherscan looks up per ``getcontractcreation`` request.
+MAX_CONTRACT_CREATION_ADDRESSES = 5
+
+# Seconds to wait for more contract-creation lookups to send together.
+_CONTRACT_CREATION_BATCH_DELAY = 0.01
+
 
 def get_network_config(
     etherscan_config: "EtherscanConfig", ecosystem_name: str, network_name: str
@@ -41,29 +65,50 @@ def get_network_config(
     return None
 
 
-@lru_cache(maxsize=None)
-def get_supported_chains():
-    response = requests.get("https://api.etherscan.io/v2/chainlist")
-    response.raise_for_status()
-    data = response.json()
-    return data.get("result", [])
+def get_ecosystem_config(
+    etherscan_config: "EtherscanConfig", ecosystem_name: str
+) -> EcosystemConfig:
+    """
+    Get the Etherscan settings for an ecosystem, falling back to the defaults
+    for ecosystems that are not configured.
+    """
+    name = ecosystem_name.lower().replace("-", "_")
+    ecosystem_config = getattr(etherscan_config, name, None)
+    if isinstance(ecosystem_config, EcosystemConfig):
+        return ecosystem_config
+    elif isinstance(ecosystem_config, dict):
+        # Custom ecosystems are not validated by the plugin config.
+        return EcosystemConfig.model_validate(ecosystem_config)
+
+    return EcosystemConfig()
+
+
+def get_supported_chains() -> list[dict]:
+    """
+    Get the chains Etherscan supports, served from the on-disk cache
+    (see :class:`~ape_etherscan.cache.ChainlistCache`).
+    """
+    return chainlist_cache.get()
+
+
+def get_supported_chain(chain_id: int) -> Optional[SupportedChain]:
+    """
+    Look up a single chain Etherscan supports by its chain ID.
+    Unlike scanning :func:`get_supported_chains`, this is a dictionary lookup.
+    """
+    return chainlist_cache.get_chain(chain_id)
 
 
 def get_etherscan_uri(
-    etherscan_config: "EtherscanConfig", ecosystem_name: str, network_name: str, chain_id: str
+    etherscan_config: "EtherscanConfig", ecosystem_name: str, network_name: str, chain_id: int
 ) -> str:
     # Look for explicitly configured Etherscan config
     network_conf = get_network_config(etherscan_config, ecosystem_name, network_name)
     if network_conf and hasattr(network_conf, "uri"):
         return str(network_conf.uri)
 
-    chains = get_supported_chains()
-    for chain in chains:
-        if chain["chainid"] != f"{chain_id}":
-            continue
-
-        # Found.
-        return chain["blockexplorer"]
+    if chain := get_supported_chain(int(chain_id)):
+        return chain.uri
 
     raise UnsupportedEcosystemError(ecosystem_name)
 
@@ -76,25 +121,26 @@ def get_etherscan_api_uri(
     if network_conf and hasattr(network_conf, "api_uri"):
         return str(network_conf.api_uri)
 
-    chains = get_supported_chains()
-    for chain in chains:
-        if chain["chainid"] != f"{chain_id}":
-            continue
-
-        # Found.
-        return chain["apiurl"]
+    if chain := get_supported_chain(int(chain_id)):
+        return chain.api_uri
 
     raise UnsupportedEcosystemError(ecosystem_name)
 
 
-class _APIClient(ManagerAccessMixin):
+class _BaseAPIClient(ManagerAccessMixin):
+    """
+    The configuration, authorization and rate limiting shared by the
+    synchronous and asynchronous clients.
+    """
+
     DEFAULT_HEADERS = {"User-Agent": USER_AGENT}
-    session = Session()
+    _retry_policy_class: type[RetryPolicy] = RetryPolicy
 
     def __init__(self, instance: EtherscanInstance, module_name: str):
         self._instance = instance
         self._module_name = module_name
-        self._last_call = 0.0
+        self._config = self._get_ecosystem_config()
+        self.retry_policy = self._retry_policy_class.from_config(self._config)
 
     @property
     def base_uri(self) -> str:
@@ -106,52 +152,96 @@ class _APIClient(ManagerAccessMixin):
 
     @property
     def _rate_limit(self) -> int:
-        config = self.config_manager.get_config("etherscan")
-        return getattr(config, self.network_manager.ecosystem.name.lower()).rate_limit
+        return self._config.rate_limit
 
     @property
     def _retries(self) -> int:
+        return self._config.retries
+
+    def refresh_config(self):
+        """
+        Re-read the Etherscan configuration for this client's ecosystem.
+        Settings are otherwise resolved once, when the client is created.
+        """
+        self._config = self._get_ecosystem_config()
+        self.retry_policy = self._retry_policy_class.from_config(self._config)
+
+    def _get_ecosystem_config(self) -> EcosystemConfig:
         config = self.config_manager.get_config("etherscan")
-        return getattr(config, self.network_manager.ecosystem.name.lower()).retries
+        return get_ecosystem_config(config, self._instance.ecosystem_name)
 
-    @property
-    def _min_time_between_calls(self) -> float:
-        return 1 / self._rate_limit  # seconds / calls per second
+    @cached_property
+    def _host(self) -> str:
+        return URL(self.base_uri).host or self.base_uri
 
     @property
     def _clean_uri(self) -> str:
         url = URL(self.base_uri).with_user(None).with_password(None)
         return f"{url.with_path('')}/[hidden]" if url.path else f"{url}"
 
+    def _authorize(self, params_or_data: Optional[dict] = None) -> Optional[dict]:
+        if params_or_data and "apikey" in params_or_data:
+            # Explicitly given.
+            return params_or_data
+
+        elif api_key := api_key_pool.select(self._host, self._rate_limit):
+            return {**(params_or_data or {}), "apikey": api_key}
+
+        return params_or_data
+
+    def _handle_response(self, response: Response, raise_on_exceptions: bool) -> EtherscanResponse:
+        # Received the final response (or gave up retrying).
+        ecosystem = self._instance.ecosystem_name
+        if raise_on_exceptions:
+            if response.status_code == 429:
+                raise EtherscanTooManyRequestsError(response, ecosystem)
+
+            response.raise_for_status()
+
+        elif not 200 <= response.status_code < 300:
+            logger.error(f"Response was not successful: {response.text}")
+
+        return EtherscanResponse(response, ecosystem, raise_on_exceptions)
+
+    def _authorize_request(
+        self, method: str, params: Optional[dict], data: Optional[dict]
+    ) -> tuple[Optional[dict], Optional[dict], Optional[str]]:
+        # NOTE: Authorize each attempt so retries may use a different key.
+        if method.upper() == "GET":
+            params = self._authorize(params)
+            return params, data, (params or {}).get("apikey")
+
+        data = self._authorize(data)
+        return params, data, (data or {}).get("apikey")
+
+
+class _APIClient(_BaseAPIClient):
+    # NOTE: Set on the class (or a client) to send requests through a specific session.
+    #   Otherwise, each API host gets a pooled session (see ``SessionPool``).
+    session: Optional[Session] = None
+
+    def _get_session(self) -> Session:
+        return self.session or session_pool.get(self._host, self._config)
+
     def _get(
         self,
         params: Optional[dict] = None,
         headers: Optional[dict[str, str]] = None,
         raise_on_exceptions: bool = True,
+        deadline: Optional[Deadline] = None,
     ) -> EtherscanResponse:
-        params = self.__authorize(params)
-
-        # Rate limit
-        if time.time() - self._last_call < self._min_time_between_calls:
-            time_to_sleep = self._min_time_between_calls - (time.time() - self._last_call)
-            logger.debug(f"Sleeping {time_to_sleep} seconds to avoid rate limit")
-            # NOTE: Sleep time is in seconds (float for subseconds)
-            time.sleep(time_to_sleep + 0.01)  # Just a little extra to avoid tripping rate limit
-
-        self._last_call = time.time()
-
         return self._request(
             "GET",
             params=params,
             headers=headers,
             raise_on_exceptions=raise_on_exceptions,
+            deadline=deadline,
         )
 
     def _post(
         self, json_dict: Optional[dict] = None, headers: Optional[dict[str, str]] = None
     ) -> EtherscanResponse:
-        data = self.__authorize(json_dict)
-        return self._request("POST", data=data, headers=headers)
+        return self._request("POST", data=json_dict, headers=headers)
 
     def _request(
         self,
@@ -160,50 +250,164 @@ class _APIClient(ManagerAccessMixin):
         headers: Optional[dict] = None,
         params: Optional[dict] = None,
         data: Optional[dict] = None,
+        deadline: Optional[Deadline] = None,
     ) -> EtherscanResponse:
         headers = headers or self.DEFAULT_HEADERS
         if not self._retries:
             raise ValueError(f"Retries must be at least 1: {self._retries}")
 
-        response = None
-        for i in range(self._retries):
+        deadline = deadline or Deadline()
+        policy = self.retry_policy
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            request_params, request_data, api_key = self._authorize_request(method, params, data)
+            # NOTE: Limits are shared by every client using the same key and host.
+            get_rate_limiter(api_key, self._host, self._rate_limit).acquire()
+            deadline.check()
             logger.debug(f"Request sent to {self._clean_uri}.")
-            response = self.session.request(
-                method.upper(),
-                self.base_uri,
-                headers=headers,
-                params=params,
-                data=data,
-                timeout=1024,
-            )
-            if response.status_code == 429:
-                time_to_sleep = 2**i
-                logger.debug(f"Request was throttled. Retrying in {time_to_sleep} seconds.")
+            try:
+                response = self._get_session().request(
+                    method.upper(),
+                    self.base_uri,
+                    headers=headers,
+                    params=request_params,
+                    data=request_data,
+                    timeout=(
+                        deadline.clamp(self._config.connect_timeout),
+                        deadline.clamp(self._config.read_timeout),
+                    ),
+                )
+            except policy.retry_errors as err:
+                time_to_sleep = policy.get_error_delay(err, attempt, started, method, deadline)
+                if time_to_sleep is None:
+                    raise
+
+                logger.debug(f"Request failed ({err}). Retrying in {time_to_sleep:.2f} seconds.")
                 time.sleep(time_to_sleep)
+                attempt += 1
                 continue
 
-            # Received a real response unrelated to rate limiting.
-            if raise_on_exceptions:
-                response.raise_for_status()
-            elif not 200 <= response.status_code < 300:
-                logger.error(f"Response was not successful: {response.text}")
+            if api_key and is_rate_limited(response):
+                api_key_pool.quarantine(api_key)
 
-            break
+            if policy.is_retryable(response, method):
+                time_to_sleep = policy.get_delay(attempt, started, response, deadline=deadline)
+                if time_to_sleep is not None:
+                    logger.debug(
+                        f"Request was throttled or failed ({response.status_code}). "
+                        f"Retrying in {time_to_sleep:.2f} seconds."
+                    )
+                    time.sleep(time_to_sleep)
+                    attempt += 1
+                    continue
 
-        if response:
-            return EtherscanResponse(response, self._instance.ecosystem_name, raise_on_exceptions)
-        else:
-            # Not possible (I don't think); just for type-checking.
-            raise ValueError("No response.")
+            return self._handle_response(response, raise_on_exceptions)
 
-    def __authorize(self, params_or_data: Optional[dict] = None) -> Optional[dict]:
-        api_key = os.environ.get(ETHERSCAN_API_KEY_NAME)
-        if api_key and (not params_or_data or "apikey" not in params_or_data):
-            params_or_data = params_or_data or {}
-            api_key = random.choice(api_key.split(","))
-            params_or_data["apikey"] = api_key.strip()
 
-        return params_or_data
+def _get_source_code_data(result: EtherscanResponse) -> Optional[dict]:
+    if not (result_list := result.value):
+        return None
+
+    elif len(result_list) > 1:
+        raise UnhandledResultError(result, result_list)
+
+    data = result_list[0]
+    if not isinstance(data, dict):
+        raise UnhandledResultError(result, data)
+
+    return data
+
+
+def _to_source_code_response(
+    data: dict, result: Optional[EtherscanResponse], address: str
+) -> SourceCodeResponse:
+    if data.get("ABI") == UNVERIFIED_ABI:
+        raise ContractNotVerifiedError(result, address)
+
+    return SourceCodeResponse.model_validate(data)
+
+
+def _to_creation_data(result: EtherscanResponse) -> list[ContractCreationResponse]:
+    items = result.value or []
+    if not isinstance(items, list):
+        raise ValueError("Expecting list.")
+
+    return [ContractCreationResponse.model_validate(item) for item in items]
+
+
+def _to_list(result: EtherscanResponse) -> list:
+    value = result.value or []
+    if not isinstance(value, list):
+        raise UnhandledResultError(result, value)
+
+    return value
+
+
+def _to_transactions(result: EtherscanResponse) -> list[EtherscanTransaction]:
+    return [EtherscanTransaction(tx) for tx in _to_list(result)]
+
+
+class _RequestCoalescer:
+    """
+    Shares the result of a lookup between the callers asking for the same key
+    at the same time, and remembers it for a short while after, so back-to-back
+    lookups (such as for a contract type and then a manifest) share one request.
+    Errors are shared with the callers that were waiting, but not remembered.
+    """
+
+    _MAX_SIZE = 256
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            if (entry := self._results.get(key)) and entry[0] > time.monotonic():
+                return entry[1]
+            elif future := self._in_flight.get(key):
+                is_owner = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                is_owner = True
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as err:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+            future.set_exception(err)
+            raise
+
+        with self._lock:
+            now = time.monotonic()
+            if len(self._results) >= self._MAX_SIZE:
+                self._results = {k: v for k, v in self._results.items() if v[0] > now}
+
+            self._results[key] = (now + self.ttl, result)
+            self._in_flight.pop(key, None)
+
+        future.set_result(result)
+        return result
+
+    def forget(self, key: Hashable):
+        with self._lock:
+            self._results.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._results = {}
+
+
+_source_code_requests = _RequestCoalescer(_SOURCE_CODE_MEMO_TTL)
 
 
 class ContractClient(_APIClient):
@@ -212,27 +416,39 @@ class ContractClient(_APIClient):
         super().__init__(instance, "contract")
 
     def get_source_code(self) -> SourceCodeResponse:
-        params = {
-            **self.base_params,
-            "action": "getsourcecode",
-            "address": self._address,
-        }
-        result = self._get(params=params)
-
-        if not (result_list := result.value):
-            return SourceCodeResponse()
+        return _source_code_requests.get(self._source_code_key, self._get_source_code)
 
-        elif len(result_list) > 1:
-            raise UnhandledResultError(result, result_list)
+    def forget_source_code(self):
+        """
+        Forget the remembered ``getsourcecode`` result for the contract, such as a
+        "not verified" one once the contract is verified.
+        """
+        _source_code_requests.forget(self._source_code_key)
+        if (chain_id := self._instance.chain_id) is not None:
+            source_code_cache.delete(chain_id, self._address)
 
-        data = result_list[0]
-        if not isinstance(data, dict):
-            raise UnhandledResultError(result, data)
-
-        if data.get("ABI") == "Contract source code not verified":
-            raise ContractNotVerifiedError(result, self._address)
-
-        return SourceCodeResponse.model_validate(data)
+    @property
+    def _source_code_key(self) -> tuple:
+        return (self._instance.api_uri, self._instance.chain_id, self._address.lower())
+
+    def _get_source_code(self) -> SourceCodeResponse:
+        # NOTE: Only cache results when the chain is known.
+        chain_id = self._instance.chain_id if self._config.cache_source_code else None
+        result = None
+        if chain_id is None or (data := source_code_cache.get(chain_id, self._address)) is None:
+            params = {
+                **self.base_params,
+                "action": "getsourcecode",
+                "address": self._address,
+            }
+            result = self._get(params=params)
+            if (data := _get_source_code_data(result)) is None:
+                return SourceCodeResponse()
+
+            elif chain_id is not None:
+                source_code_cache.set(chain_id, self._address, data)
+
+        return _to_source_code_response(data, result, self._address)
 
     def verify_source_code(
         self,
@@ -287,23 +503,99 @@ class ContractClient(_APIClient):
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         return str(self._post(json_dict=json_dict, headers=headers).value)
 
-    def check_verify_status(self, guid: str) -> str:
+    @property
+    def verification_timeout(self) -> float:
+        """
+        The seconds to wait for a verification to finish.
+        """
+        return self._config.verification_timeout
+
+    def check_verify_status(self, guid: str, deadline: Optional[Deadline] = None) -> str:
         json_dict = {**self.base_params, "action": "checkverifystatus", "guid": guid}
-        response = self._get(params=json_dict, raise_on_exceptions=False)
+        response = self._get(params=json_dict, raise_on_exceptions=False, deadline=deadline)
         return str(response.value)
 
-    def get_creation_data(self) -> list[ContractCreationResponse]:
+    def get_creation_data(
+        self, other_addresses: Optional[list[str]] = None
+    ) -> list[ContractCreationResponse]:
+        """
+        Get the creation data of the contract.
+
+        Args:
+            other_addresses (list[str] | None): More contracts to look up in the same
+              request. Etherscan accepts up to
+              :data:`~ape_etherscan.client.MAX_CONTRACT_CREATION_ADDRESSES` in total.
+
+        Returns:
+            list[:class:`~ape_etherscan.types.ContractCreationResponse`]
+        """
+        addresses = [self._address, *(other_addresses or [])]
         params = {
             **self.base_params,
             "action": "getcontractcreation",
-            "contractaddresses": [self._address],
+            "contractaddresses": [",".join(addresses)],
         }
-        result = self._get(params=params)
-        items = result.value or []
-        if not isinstance(items, list):
-            raise ValueError("Expecting list.")
+        return _to_creation_data(self._get(params=params))
+
+
+class _ResultWindow:
+    """
+    Tracks the transactions of a paginated ``txlist`` query, to tell whether
+    Etherscan's result window cut it short and where to continue from.
+    """
+
+    def __init__(self, offset: int, skip: frozenset[str] = frozenset()):
+        self.size = max(MAX_RESULT_WINDOW // offset, 1) * offset
+        self.skip = skip
+        self.count = 0
+        self._boundary_block: Optional[str] = None
+        self._boundary_hashes: set[str] = set()
+
+    def filter(self, page: list[EtherscanTransaction]) -> Iterator[EtherscanTransaction]:
+        """
+        Track a page of transactions and yield the ones not seen before.
+        """
+        self.count += len(page)
+        for tx in page:
+            # Track the transactions in the last block seen,
+            # as the result window may have cut that block short.
+            if (block := tx.get("blockNumber")) != self._boundary_block:
+                self._boundary_block = block
+                self._boundary_hashes = set()
+
+            if tx_hash := tx.get("hash"):
+                self._boundary_hashes.add(tx_hash)
+
+            if tx_hash not in self.skip:
+                yield tx
+
+    def get_next_range(
+        self, start_block: Optional[int], end_block: Optional[int], sort: str, address: str
+    ) -> Optional[tuple[Optional[int], Optional[int], frozenset[str]]]:
+        """
+        Get the blocks left to query, and the transactions to skip in them,
+        or None when the query got everything in its range.
+        """
+        if self.count < self.size or self._boundary_block is None:
+            return None
+
+        # The result window is saturated. Continue from the last block seen,
+        # skipping the transactions from that block we already have.
+        next_block = int(self._boundary_block)
+        skip = frozenset(self._boundary_hashes)
+        is_desc = sort == "desc"
+        bound = end_block if is_desc else start_block
+        if bound is not None and next_block == bound:
+            logger.warning(
+                f"Block {next_block} has more than {self.size} transactions "
+                f"for '{address}'. Some are missing."
+            )
+            next_block, skip = next_block + (-1 if is_desc else 1), frozenset()
+
+        if is_desc:
+            return start_block, next_block, skip
 
-        return [ContractCreationResponse.model_validate(item) for item in items]
+        return next_block, end_block, skip
 
 
 class AccountClient(_APIClient):
@@ -317,22 +609,266 @@ class AccountClient(_APIClient):
         end_block: Optional[int] = None,
         offset: int = 100,
         sort: str = "asc",
-    ) -> Iterator[dict]:
-        page_num = 1
-        last_page_results = offset  # Start at offset to trigger iteration
-        while last_page_results == offset:
-            page = self._get_page_of_normal_transactions(
-                page_num, start_block, end_block, offset=offset, sort=sort
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[EtherscanTransaction]:
+        """
+        Get all the normal transactions for the account. Etherscan only serves
+        the first 10,000 results of a query, so once a block range fills that
+        window, the rest of the range is queried separately (concurrently, when
+        both ends of the range are known). When ``cache_transactions`` is
+        enabled, the transactions are stored locally and only blocks after the
+        last one stored are requested.
+
+        Args:
+            start_block (int | None): The first block to include.
+            end_block (int | None): The last block to include.
+            offset (int): The number of transactions per page. Defaults to ``100``.
+            sort (str): ``"asc"`` or ``"desc"``. Defaults to ``"asc"``.
+            concurrency (int | None): The number of pages to keep in flight at once.
+              Defaults to the ecosystem's configured ``concurrency``.
+            timeout (float | None): The most seconds to spend requesting transactions,
+              counted from the first request. Defaults to no limit.
+
+        Raises:
+            :class:`~ape_etherscan.exceptions.EtherscanTimeoutError`: When the
+              transactions are not all received in time.
+
+        Returns:
+            Iterator[:class:`~ape_etherscan.types.EtherscanTransaction`]
+        """
+        concurrency = self._config.concurrency if concurrency is None else concurrency
+        deadline = Deadline(timeout)
+        if not self._config.cache_transactions or (chain_id := self._instance.chain_id) is None:
+            yield from self._get_normal_transactions_in_range(
+                start_block, end_block, offset, sort, concurrency, deadline
+            )
+            return
+
+        self._sync_normal_transactions(chain_id, end_block, offset, concurrency, deadline)
+        for tx in transaction_cache.get_transactions(
+            chain_id, self._address, start_block=start_block, end_block=end_block, sort=sort
+        ):
+            yield EtherscanTransaction(tx)
+
+    def get_transaction_batches(
+        self,
+        start_block: Optional[int] = None,
+        end_block: Optional[int] = None,
+        sort: str = "asc",
+        batch_size: int = 10_000,
+        timeout: Optional[float] = None,
+    ) -> Iterator[dict[str, "np.ndarray"]]:
+        """
+        Get all the normal transactions for the account as columns, one NumPy
+        array per field, ``batch_size`` transactions at a time. Each batch can
+        be passed to ``pandas.DataFrame`` as-is or written to a Parquet file
+        with :func:`~ape_etherscan.columnar.write_parquet`. See
+        :func:`~ape_etherscan.columnar.to_columns` for the columns.
+
+        Args:
+            start_block (int | None): The first block to include.
+            end_block (int | None): The last block to include.
+            sort (str): ``"asc"`` or ``"desc"``. Defaults to ``"asc"``.
+            batch_size (int): The most transactions per batch. Defaults to ``10_000``.
+            timeout (float | None): The most seconds to spend requesting transactions.
+
+        Returns:
+            Iterator[dict[str, ``numpy.ndarray``]]
+        """
+        # NOTE: Imported here, so loading the plugin does not import NumPy.
+        from ape_etherscan.columnar import iter_batches
+
+        # NOTE: Bulk exports use larger pages, for fewer requests.
+        transactions = self.get_all_normal_transactions(
+            start_block=start_block,
+            end_block=end_block,
+            offset=1_000,
+            sort=sort,
+            timeout=timeout,
+        )
+        yield from iter_batches(transactions, batch_size=batch_size)
+
+    def _sync_normal_transactions(
+        self,
+        chain_id: int,
+        end_block: Optional[int],
+        offset: int,
+        concurrency: int,
+        deadline: Deadline,
+    ):
+        # Only request the blocks after the last one stored.
+        last_block = transaction_cache.get_last_block(chain_id, self._address)
+        if last_block is not None and end_block is not None and end_block <= last_block:
+            return
+
+        start_block = None if last_block is None else last_block + 1
+        transactions = self._get_normal_transactions_in_range(
+            start_block, None, offset, "asc", concurrency, deadline
+        )
+        transaction_cache.add(chain_id, self._address, (tx.to_dict() for tx in transactions))
+
+    def _get_normal_transactions_in_range(
+        self,
+        start_block: Optional[int],
+        end_block: Optional[int],
+        offset: int,
+        sort: str,
+        concurrency: int,
+        deadline: Deadline,
+        skip: frozenset[str] = frozenset(),
+        stop: Optional[threading.Event] = None,
+    ) -> Iterator[EtherscanTransaction]:
+        # NOTE: A loop, not recursion, as there can be thousands of windows.
+        while True:
+            window = _ResultWindow(offset, skip)
+            for page in self._get_pages_of_normal_transactions(
+                start_block,
+                end_block,
+                offset=offset,
+                sort=sort,
+                concurrency=concurrency,
+                deadline=deadline,
+            ):
+                yield from window.filter(page)
+                if stop is not None and stop.is_set():
+                    return
+
+            if not (
+                next_range := window.get_next_range(start_block, end_block, sort, self._address)
+            ):
+                return
+
+            start_block, end_block, skip = next_range
+            if (
+                concurrency > 1
+                and start_block is not None
+                and end_block is not None
+                and end_block - start_block >= concurrency
+            ):
+                yield from self._get_sharded_normal_transactions(
+                    start_block, end_block, offset, sort, concurrency, deadline, skip
+                )
+                return
+
+    def _get_sharded_normal_transactions(
+        self,
+        start_block: int,
+        end_block: int,
+        offset: int,
+        sort: str,
+        concurrency: int,
+        deadline: Deadline,
+        skip: frozenset[str],
+    ) -> Iterator[EtherscanTransaction]:
+        # Split the remaining blocks into ranges fetched at the same time.
+        size = (end_block - start_block + 1) // concurrency
+        ranges = [
+            (start_block + i * size, start_block + (i + 1) * size - 1) for i in range(concurrency)
+        ]
+        ranges[-1] = (ranges[-1][0], end_block)
+        if sort == "desc":
+            ranges.reverse()
+
+        # NOTE: The first range streams in this thread, so stopping early stops
+        #   it right away; the others are fetched ahead and told to stop.
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=concurrency - 1)
+        try:
+            futures = [
+                executor.submit(
+                    lambda r: list(
+                        self._get_normal_transactions_in_range(
+                            *r, offset, sort, 1, deadline, stop=stop
+                        )
+                    ),
+                    block_range,
+                )
+                for block_range in ranges[1:]
+            ]
+            # NOTE: Only the range with the last block seen can have duplicates.
+            yield from self._get_normal_transactions_in_range(
+                *ranges[0], offset, sort, 1, deadline, skip=skip
             )
-            new_items = len(page)
-            if new_items:
-                yield from page
+            for future in futures:
+                yield from future.result()
 
-            last_page_results = new_items
-            page_num += 1
-            if new_items <= 0:
-                # No more items. Break now to avoid 500 errors.
-                break
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pages_of_normal_transactions(
+        self,
+        start_block: Optional[int] = None,
+        end_block: Optional[int] = None,
+        offset: int = 100,
+        sort: str = "asc",
+        concurrency: int = 1,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[list[EtherscanTransaction]]:
+        # NOTE: Etherscan refuses to page past `page * offset > MAX_RESULT_WINDOW`.
+        last_page_num = max(MAX_RESULT_WINDOW // offset, 1)
+
+        # Fetch the first page alone; most accounts fit on it.
+        page = self._get_page_of_normal_transactions(
+            1, start_block, end_block, offset, sort, deadline
+        )
+        if page:
+            yield page
+
+        if len(page) < offset:
+            return
+
+        elif concurrency <= 1:
+            for page_num in range(2, last_page_num + 1):
+                page = self._get_page_of_normal_transactions(
+                    page_num, start_block, end_block, offset, sort, deadline
+                )
+                if page:
+                    yield page
+
+                if len(page) < offset:
+                    # No more items. Break now to avoid 500 errors.
+                    break
+
+            return
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        in_flight: deque[Future] = deque()
+        next_page_num = 2
+
+        def fill():
+            nonlocal next_page_num
+            while len(in_flight) < concurrency and next_page_num <= last_page_num:
+                in_flight.append(
+                    executor.submit(
+                        self._get_page_of_normal_transactions,
+                        next_page_num,
+                        start_block,
+                        end_block,
+                        offset,
+                        sort,
+                        deadline,
+                    )
+                )
+                next_page_num += 1
+
+        try:
+            fill()
+            while in_flight:
+                # NOTE: Results are consumed in page order to preserve `sort`.
+                page = in_flight.popleft().result()
+                if page:
+                    yield page
+
+                if len(page) < offset:
+                    # No more items. Stop now to avoid 500 errors.
+                    break
+
+                fill()
+
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def _get_page_of_normal_transactions(
         self,
@@ -341,7 +877,8 @@ class AccountClient(_APIClient):
         end_block: Optional[int] = None,
         offset: int = 100,
         sort: str = "asc",
-    ) -> list[dict]:
+        deadline: Optional[Deadline] = None,
+    ) -> list[EtherscanTransaction]:
         params = {
             **self.base_params,
             "action": "txlist",
@@ -352,21 +889,188 @@ class AccountClient(_APIClient):
             "offset": offset,
             "sort": sort,
         }
-        result = self._get(params=params)
-
-        value = result.value or []
-        if not isinstance(value, list):
-            raise UnhandledResultError(result, value)
-
-        return value
+        return _to_transactions(self._get(params=params, deadline=deadline))
 
 
 class ClientFactory:
     def __init__(self, instance: EtherscanInstance):
         self._instance = instance
+        self.creation_data_batcher = ContractCreationBatcher(self)
 
     def get_contract_client(self, contract_address: str) -> ContractClient:
         return ContractClient(self._instance, contract_address)
 
     def get_account_client(self, account_address: str) -> AccountClient:
         return AccountClient(self._instance, account_address)
+
+    def get_creation_data(
+        self, contract_addresses: Iterable[str]
+    ) -> dict[str, Optional[ContractCreationResponse]]:
+        """
+        Get the creation data of many contracts, sending up to
+        :data:`~ape_etherscan.client.MAX_CONTRACT_CREATION_ADDRESSES` per request.
+
+        Args:
+            contract_addresses (Iterable[str]): The contracts.
+
+        Returns:
+            dict[str, :class:`~ape_etherscan.types.ContractCreationResponse` | None]:
+            The creation data of each contract, or None when Etherscan has none.
+        """
+        addresses = list(dict.fromkeys(contract_addresses))
+        results: dict[str, Optional[ContractCreationResponse]] = {a: None for a in addresses}
+        by_lower = {a.lower(): a for a in addresses}
+        for start in range(0, len(addresses), MAX_CONTRACT_CREATION_ADDRESSES):
+            end = start + MAX_CONTRACT_CREATION_ADDRESSES
+            batch = addresses[start:end]
+            client = self.get_contract_client(batch[0])
+            for creation_data in client.get_creation_data(other_addresses=batch[1:]):
+                if address := by_lower.get(creation_data.contractAddress.lower()):
+                    results[address] = creation_data
+
+        return results
+
+
+class ContractCreationBatcher:
+    """
+    Collects the contract-creation lookups made at about the same time (such as
+    from many threads) and sends them together, so that each request looks up
+    as many contracts as Etherscan allows.
+    """
+
+    def __init__(
+        self, client_factory: ClientFactory, delay: float = _CONTRACT_CREATION_BATCH_DELAY
+    ):
+        self._client_factory = client_factory
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._pending: dict[str, Future] = {}
+        self._queue: list[str] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def get(self, contract_address: str) -> Optional[ContractCreationResponse]:
+        """
+        Get the creation data of a contract, waiting briefly for other lookups
+        to send along in the same request.
+
+        Args:
+            contract_address (str): The contract.
+
+        Returns:
+            :class:`~ape_etherscan.types.ContractCreationResponse` | None: None when
+            Etherscan has no creation data for the contract.
+        """
+        batch = None
+        with self._lock:
+            if (future := self._pending.get(contract_address.lower())) is None:
+                future = Future()
+                self._pending[contract_address.lower()] = future
+                self._queue.append(contract_address)
+                if len(self._queue) >= MAX_CONTRACT_CREATION_ADDRESSES:
+                    # A full batch; no reason to wait.
+                    batch = self._take_batch()
+                elif self._timer is None:
+                    self._timer = threading.Timer(self.delay, self._flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if batch:
+            self._send(batch)
+
+        return future.result()
+
+    def _take_batch(self) -> list[str]:
+        batch = self._queue[:MAX_CONTRACT_CREATION_ADDRESSES]
+        self._queue = self._queue[MAX_CONTRACT_CREATION_ADDRESSES:]
+        return batch
+
+    def _flush(self):
+        while True:
+            with self._lock:
+                if not (batch := self._take_batch()):
+                    self._timer = None
+                    return
+
+            self._send(batch)
+
+    def _send(self, batch: list[str]):
+        try:
+            results = self._client_factory.get_creation_data(batch)
+        except BaseException as err:
+            for address in batch:
+                if future := self._pending.pop(address.lower(), None):
+                    future.set_exception(err)
+
+            return
+
+        for address in batch:
+            if future := self._pending.pop(address.lower(), None):
+                future.set_result(results.get(address))
+
+
+class _ClientFactoryCache:
+    def __init__(self):
+        self._factories: dict[tuple, ClientFactory] = {}
+        self._config: Optional["EtherscanConfig"] = None
+        self._config_hash: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        etherscan_config: "EtherscanConfig",
+        ecosystem_name: str,
+        network_name: str,
+        chain_id: int,
+    ) -> ClientFactory:
+        network_name = network_name.replace("-fork", "")
+        key = (ecosystem_name, network_name, chain_id, self._hash_config(etherscan_config))
+        if factory := self._factories.get(key):
+            return factory
+
+        instance = EtherscanInstance(
+            ecosystem_name=ecosystem_name,
+            network_name=network_name,
+            uri=get_etherscan_uri(etherscan_config, ecosystem_name, network_name, chain_id),
+            api_uri=get_etherscan_api_uri(etherscan_config, ecosystem_name, network_name, chain_id),
+            chain_id=chain_id,
+        )
+        factory = ClientFactory(instance)
+        self._factories[key] = factory
+        return factory
+
+    def clear(self):
+        with self._lock:
+            self._factories = {}
+            self._config = None
+            self._config_hash = None
+
+    def _hash_config(self, etherscan_config: "EtherscanConfig") -> int:
+        # NOTE: Ape keeps the decoded config object around until the config changes,
+        #   so only hash it when we are handed a different object.
+        if etherscan_config is self._config and self._config_hash is not None:
+            return self._config_hash
+
+        with self._lock:
+            config_hash = hash(etherscan_config.model_dump_json())
+            if config_hash != self._config_hash:
+                # The config changed; everything built from the old one is outdated.
+                self._factories = {}
+
+            self._config = etherscan_config
+            self._config_hash = config_hash
+
+        return config_hash
+
+
+_client_factories = _ClientFactoryCache()
+
+
+def get_client_factory(
+    etherscan_config: "EtherscanConfig", ecosystem_name: str, network_name: str, chain_id: int
+) -> ClientFactory:
+    """
+    Get the (memoized) client factory for a network. Factories are cached per
+    ecosystem, network, chain ID and Etherscan configuration, so repeated lookups
+    do not re-resolve configuration or explorer URIs.
+    """
+    return _client_factories.get(etherscan_config, ecosystem_name, network_name, chain_id)
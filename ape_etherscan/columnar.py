@@ -0,0 +1,231 @@
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
+
+from ape_etherscan.exceptions import ApeEtherscanException
+from ape_etherscan.types import EtherscanTransaction
+
+if TYPE_CHECKING:
+    from pyarrow import Schema, Table
+
+# Column names by Etherscan field.
+_INT_COLUMNS = {
+    "blockNumber": "block_number",
+    "timeStamp": "timestamp",
+    "nonce": "nonce",
+    "transactionIndex": "transaction_index",
+    "gas": "gas_limit",
+    "gasPrice": "gas_price",
+    "gasUsed": "gas_used",
+    "cumulativeGasUsed": "cumulative_gas_used",
+    "confirmations": "confirmations",
+}
+_BYTES_COLUMNS = {
+    "hash": ("hash", 32),
+    "blockHash": ("block_hash", 32),
+    "from": ("sender", 20),
+    "to": ("receiver", 20),
+    "contractAddress": ("contract_address", 20),
+    "methodId": ("method_id", 4),
+}
+_BOOL_COLUMNS = {"isError": "is_error", "txreceipt_status": "status"}
+_STR_COLUMNS = {"input": "input", "functionName": "function_name"}
+
+# The suffix of the columns telling which values are present.
+_VALID_SUFFIX = "_valid"
+
+# Wei amounts do not fit in 64 bits.
+_VALUE_PRECISION = 76
+
+
+def to_columns(transactions: Iterable[EtherscanTransaction]) -> dict[str, np.ndarray]:
+    """
+    Convert transactions to columns, one NumPy array per field, converting
+    each column at once instead of each transaction. The result can be passed
+    to ``pandas.DataFrame`` as-is.
+
+    Numbers are ``uint64``, except for ``value``, which holds Python ints.
+    Hashes and addresses are fixed-width bytes (``V32``/``V20``); use ``bytes()``
+    on an item to get its value. ``input`` and ``function_name`` are strings.
+
+    Numbers, bytes and booleans that are missing (such as the receiver of a
+    contract creation or the method ID of a plain transfer) hold ``0``, zero
+    bytes or ``False``, so each of these columns comes with a ``<name>_valid``
+    boolean column that is ``False`` for the missing values. A missing ``value``
+    is ``None``.
+
+    Args:
+        transactions (Iterable[:class:`~ape_etherscan.types.EtherscanTransaction`]):
+          The transactions.
+
+    Returns:
+        dict[str, ``numpy.ndarray``]
+    """
+    transactions = list(transactions)
+    if not transactions:
+        return _empty_columns()
+
+    fields = EtherscanTransaction.get_columns(transactions)
+    columns: dict[str, np.ndarray] = {}
+    for field, name in _INT_COLUMNS.items():
+        columns[name], columns[f"{name}{_VALID_SUFFIX}"] = _to_ints(fields[field])
+
+    for field, (name, size) in _BYTES_COLUMNS.items():
+        columns[name], columns[f"{name}{_VALID_SUFFIX}"] = _to_bytes(fields[field], size)
+
+    for field, name in _BOOL_COLUMNS.items():
+        columns[name], columns[f"{name}{_VALID_SUFFIX}"] = _to_bools(fields[field])
+
+    columns["value"] = np.array([int(v) if v else None for v in fields["value"]], dtype=object)
+    for field, name in _STR_COLUMNS.items():
+        columns[name] = np.array([v or "" for v in fields[field]], dtype=object)
+
+    if any(len(column) != len(transactions) for column in columns.values()):
+        raise ApeEtherscanException("Transaction columns have mismatched lengths.")
+
+    return columns
+
+
+def iter_batches(
+    transactions: Iterable[EtherscanTransaction], batch_size: int = 10_000
+) -> Iterator[dict[str, np.ndarray]]:
+    """
+    Convert transactions to columns, ``batch_size`` transactions at a time.
+
+    Args:
+        transactions (Iterable[:class:`~ape_etherscan.types.EtherscanTransaction`]):
+          The transactions, such as from
+          :meth:`~ape_etherscan.client.AccountClient.get_all_normal_transactions`.
+        batch_size (int): The most transactions per batch.
+
+    Returns:
+        Iterator[dict[str, ``numpy.ndarray``]]
+    """
+    transactions = iter(transactions)
+    while batch := list(islice(transactions, batch_size)):
+        yield to_columns(batch)
+
+
+def write_parquet(batches: Iterable[dict[str, np.ndarray]], path: Union[str, Path]) -> int:
+    """
+    Write batches of columns (see :func:`~ape_etherscan.columnar.to_columns`)
+    to a Parquet file, one batch at a time. Requires ``pyarrow``. Missing values
+    are written as nulls, instead of as separate ``<name>_valid`` columns.
+
+    Args:
+        batches (Iterable[dict[str, ``numpy.ndarray``]]): The batches.
+        path (str | Path): The file to write.
+
+    Returns:
+        int: The number of transactions written.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as err:
+        raise ApeEtherscanException(
+            "Writing Parquet files requires 'pyarrow'. "
+            "Install it using `pip install 'ape-etherscan[parquet]'`."
+        ) from err
+
+    schema = _get_schema()
+    count = 0
+    with pq.ParquetWriter(str(path), schema) as writer:
+        for batch in batches:
+            if num_rows := len(batch["hash"]):
+                writer.write_table(_to_table(batch, schema))
+                count += num_rows
+
+    return count
+
+
+def _to_ints(values: tuple) -> tuple[np.ndarray, np.ndarray]:
+    if "" in values or None in values:
+        valid = np.array([bool(v) for v in values])
+        values = tuple([v or "0" for v in values])
+    else:
+        valid = np.ones(len(values), dtype=bool)
+
+    # NOTE: Parses all the (decimal) strings in one go.
+    return np.array(values).astype(np.uint64), valid
+
+
+def _to_bytes(values: tuple, size: int) -> tuple[np.ndarray, np.ndarray]:
+    # NOTE: Anything but a full-width value (such as the `"0x"` method ID
+    #   of plain transfers) is missing, so each row keeps exactly `size` bytes.
+    width = 2 + 2 * size
+    empty = "00" * size
+    valid = np.array([bool(v) and len(v) == width for v in values], dtype=bool)
+    hex_str = "".join([v[2:] if is_valid else empty for v, is_valid in zip(values, valid)])
+    return np.frombuffer(bytes.fromhex(hex_str), dtype=f"V{size}"), valid
+
+
+def _to_bools(values: tuple) -> tuple[np.ndarray, np.ndarray]:
+    is_true = np.array([v == "1" for v in values], dtype=bool)
+    is_false = np.array([v == "0" for v in values], dtype=bool)
+    return is_true, is_true | is_false
+
+
+def _empty_columns() -> dict[str, np.ndarray]:
+    columns: dict[str, np.ndarray] = {}
+    for name in _INT_COLUMNS.values():
+        columns[name] = np.array([], dtype=np.uint64)
+        columns[f"{name}{_VALID_SUFFIX}"] = np.array([], dtype=bool)
+
+    for name, size in _BYTES_COLUMNS.values():
+        columns[name] = np.array([], dtype=f"V{size}")
+        columns[f"{name}{_VALID_SUFFIX}"] = np.array([], dtype=bool)
+
+    for name in _BOOL_COLUMNS.values():
+        columns[name] = np.array([], dtype=bool)
+        columns[f"{name}{_VALID_SUFFIX}"] = np.array([], dtype=bool)
+
+    columns["value"] = np.array([], dtype=object)
+    for name in _STR_COLUMNS.values():
+        columns[name] = np.array([], dtype=object)
+
+    return columns
+
+
+def _get_schema() -> "Schema":
+    import pyarrow as pa
+
+    fields = [pa.field(name, pa.uint64()) for name in _INT_COLUMNS.values()]
+    fields.extend(pa.field(name, pa.binary(size)) for name, size in _BYTES_COLUMNS.values())
+    fields.extend(pa.field(name, pa.bool_()) for name in _BOOL_COLUMNS.values())
+    fields.append(pa.field("value", pa.decimal256(_VALUE_PRECISION, 0)))
+    fields.extend(pa.field(name, pa.string()) for name in _STR_COLUMNS.values())
+    return pa.schema(fields)
+
+
+def _to_table(batch: dict[str, np.ndarray], schema: "Schema") -> "Table":
+    import pyarrow as pa
+
+    num_rows = len(batch["hash"])
+    arrays = []
+    for field in schema:
+        column = batch[field.name]
+        valid = batch.get(f"{field.name}{_VALID_SUFFIX}")
+        if field.name == "value":
+            values = [None if v is None else Decimal(v) for v in column]
+            arrays.append(pa.array(values, type=field.type))
+
+        elif isinstance(field.type, pa.FixedSizeBinaryType):
+            # NOTE: Use the bytes as they are, without a copy, with missing values as nulls.
+            buffer = pa.py_buffer(np.ascontiguousarray(column).tobytes())
+            validity = None
+            if valid is not None and not valid.all():
+                validity = pa.py_buffer(np.packbits(valid, bitorder="little").tobytes())
+
+            arrays.append(pa.Array.from_buffers(field.type, num_rows, [validity, buffer]))
+
+        elif valid is not None:
+            arrays.append(pa.array(column, type=field.type, mask=~valid))
+
+        else:
+            arrays.append(pa.array(column, type=field.type))
+
+    return pa.Table.from_arrays(arrays, schema=schema)
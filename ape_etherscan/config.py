@@ -15,6 +15,16 @@ class EcosystemConfig(PluginConfig):
 
     rate_limit: int = 5  # Requests per second
     retries: int = 5  # Number of retries before giving up
+    retry_budget: float = 120  # Max seconds to spend on a request, including retries
+    connect_timeout: float = 10  # Seconds to wait for a connection
+    read_timeout: float = 60  # Seconds to wait for the server to respond
+    verification_timeout: float = 300  # Seconds to wait for a verification to finish
+    concurrency: int = 1  # Pages to request at once for paginated lookups (opt-in)
+    cache_transactions: bool = False  # Store account transactions locally
+    cache_source_code: bool = True  # Store verified source code locally
+    pool_connections: int = 10  # Connection pools to cache per API host
+    pool_maxsize: int = 20  # Max connections to keep open per pool
+    keep_alive: bool = True  # Reuse connections between requests
 
     @model_validator(mode="after")
     def verify_extras(self) -> "EcosystemConfig":
@@ -47,3 +57,7 @@ class EtherscanConfig(PluginConfig):
     polygon_zkevm: EcosystemConfig = EcosystemConfig()
     scroll: EcosystemConfig = EcosystemConfig()
     unichain: EcosystemConfig = EcosystemConfig()
+
+    chainlist_ttl: int = 24 * 60 * 60  # Seconds before refreshing the cached chainlist
+    source_code_proxy_ttl: int = 24 * 60 * 60  # Seconds to cache the source code of proxies
+    source_code_unverified_ttl: int = 10 * 60  # Seconds to remember unverified contracts
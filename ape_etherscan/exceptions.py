@@ -34,13 +34,23 @@ class UnsupportedNetworkError(ApeEtherscanException):
         super().__init__(f"Unsupported Network for Ecosystem '{ecosystem_name}': {network_name}")
 
 
+class EtherscanTimeoutError(ApeEtherscanException):
+    """
+    Raised when an operation does not finish before its deadline.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        super().__init__(f"Operation timed out after {timeout} seconds.")
+
+
 class EtherscanResponseError(ApeEtherscanException):
     """
     Raised when the response is not correct.
     """
 
-    def __init__(self, response: Union[Response, "EtherscanResponse"], message: str):
-        if not isinstance(response, Response):
+    def __init__(self, response: Union[Response, "EtherscanResponse", None], message: str):
+        if response is not None and not isinstance(response, Response):
             response = response.response
 
         self.response = response
@@ -50,9 +60,10 @@ class EtherscanResponseError(ApeEtherscanException):
 class ContractNotVerifiedError(EtherscanResponseError):
     """
     Raised when a contract is not verified on Etherscan.
+    The response is None when the result came from the cache.
     """
 
-    def __init__(self, response: Union[Response, "EtherscanResponse"], address: str):
+    def __init__(self, response: Union[Response, "EtherscanResponse", None], address: str):
         super().__init__(response, f"Contract '{address}' not verified.")
 
 
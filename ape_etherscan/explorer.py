@@ -1,5 +1,6 @@
-import json
-from typing import TYPE_CHECKING, Optional
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Union
 
 from ape.api import ExplorerAPI, PluginConfig
 from ape.contracts import ContractInstance
@@ -11,17 +12,24 @@ from ethpm_types.source import Source
 from ape_etherscan.client import (
     ClientFactory,
     SourceCodeResponse,
+    get_client_factory,
     get_etherscan_api_uri,
     get_etherscan_uri,
+    get_supported_chain,
     get_supported_chains,
 )
 from ape_etherscan.exceptions import ContractNotVerifiedError
-from ape_etherscan.types import EtherscanInstance
+from ape_etherscan.utils import parse_json
 from ape_etherscan.verify import SourceVerifier
 
 if TYPE_CHECKING:
     from ape.managers.project import ProjectManager
 
+    from ape_etherscan.types import SupportedChain
+
+# The default number of contract types ``get_contract_types()`` looks up at once.
+_CONTRACT_TYPE_WORKERS = 4
+
 
 class Etherscan(ExplorerAPI):
     """
@@ -67,11 +75,23 @@ class Etherscan(ExplorerAPI):
         """
         return get_supported_chains()
 
+    @classmethod
+    def get_supported_chain(cls, chain_id: int) -> Optional["SupportedChain"]:
+        """
+        Get Etherscan's data for a single chain.
+
+        Args:
+            chain_id (int): The chain ID.
+
+        Returns:
+            :class:`~ape_etherscan.types.SupportedChain` | None: None when
+            the chain is not supported.
+        """
+        return get_supported_chain(chain_id)
+
     @classmethod
     def supports_chain(cls, chain_id: int) -> bool:
-        chain_data = cls.get_supported_chains()
-        chain_ids = [int(c["chainid"]) for c in chain_data if "chainid" in c]
-        return chain_id in chain_ids
+        return cls.get_supported_chain(chain_id) is not None
 
     def get_address_url(self, address: str) -> str:
         return f"{self.etherscan_uri}/address/{address}"
@@ -81,13 +101,11 @@ class Etherscan(ExplorerAPI):
 
     @property
     def _client_factory(self) -> ClientFactory:
-        return ClientFactory(
-            EtherscanInstance(
-                ecosystem_name=self.network.ecosystem.name,
-                network_name=self.network.name.replace("-fork", ""),
-                uri=self.etherscan_uri,
-                api_uri=self.etherscan_api_uri,
-            )
+        return get_client_factory(
+            self._config,
+            self.network.ecosystem.name,
+            self.network.name,
+            self.network.chain_id,
         )
 
     def get_manifest(self, address: AddressType) -> Optional[PackageManifest]:
@@ -116,7 +134,7 @@ class Etherscan(ExplorerAPI):
         code = response.source_code
         if code.startswith("{"):
             # JSON verified.
-            data = json.loads(code)
+            data = parse_json(code)
             compiler = Compiler(
                 name=data.get("language", "Solidity"),
                 version=response.compiler_version,
@@ -166,6 +184,40 @@ class Etherscan(ExplorerAPI):
 
         return contract_type
 
+    def get_contract_types(
+        self, addresses: Iterable[AddressType], max_workers: Optional[int] = None
+    ) -> dict[AddressType, Union[ContractType, None, Exception]]:
+        """
+        Get the contract types of many contracts at once. The lookups run on a
+        pool of workers, sharing the rate limit (and caches) with other requests.
+
+        Args:
+            addresses (Iterable[AddressType]): The addresses of the contracts.
+            max_workers (int | None): The number of lookups to run at once.
+              Defaults to ``4``.
+
+        Returns:
+            dict[AddressType, ContractType | None | Exception]: The contract type
+            of each address, None when the contract is not verified, or the error
+            raised while looking it up.
+        """
+        addresses = list(dict.fromkeys(addresses))
+        if max_workers is None:
+            # NOTE: Unlike pages, each lookup is needed, so none are wasted.
+            max_workers = _CONTRACT_TYPE_WORKERS
+
+        def get_contract_type(address: AddressType) -> Union[ContractType, None, Exception]:
+            try:
+                return self.get_contract_type(address)
+            except Exception as err:
+                return err
+
+        if max_workers <= 1 or len(addresses) <= 1:
+            return {address: get_contract_type(address) for address in addresses}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(addresses))) as executor:
+            return dict(zip(addresses, executor.map(get_contract_type, addresses)))
+
     def publish_contract(self, address: AddressType):
         return self._publish_contract(address)
 
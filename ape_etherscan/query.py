@@ -1,26 +1,87 @@
-from collections.abc import Iterator
-from typing import Optional
+import weakref
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 from ape.api import PluginConfig, QueryAPI, QueryType, ReceiptAPI
 from ape.api.query import AccountTransactionQuery, ContractCreation, ContractCreationQuery
-from ape.exceptions import QueryEngineError
+from ape.exceptions import ApeException, QueryEngineError
 from ape.utils import singledispatchmethod
 
-from ape_etherscan.client import ClientFactory, get_etherscan_api_uri, get_etherscan_uri
-from ape_etherscan.types import EtherscanInstance
+from ape_etherscan.cache import nonce_index
+from ape_etherscan.client import (
+    AccountClient,
+    ClientFactory,
+    get_client_factory,
+    get_etherscan_api_uri,
+    get_etherscan_uri,
+)
 from ape_etherscan.utils import NETWORKS
 
+if TYPE_CHECKING:
+    from ape.api import ProviderAPI
+    from ape.types import AddressType
+
+
+class _ChainIDCache:
+    """
+    The chain IDs of the connected provider and of its network. Some providers
+    ask the node on every lookup, so they are looked up once, and forgotten when
+    the provider or its network changes.
+    """
+
+    def __init__(self):
+        self._state: Optional[tuple[weakref.ref, str, dict[str, int]]] = None
+
+    def get_chain_id(self, provider: "ProviderAPI") -> int:
+        """
+        Get the provider's ``chain_id``.
+        """
+        return self._get(provider, "provider", lambda: provider.chain_id)
+
+    def get_network_chain_id(self, provider: "ProviderAPI") -> int:
+        """
+        Get the ``chain_id`` of the provider's network (the upstream chain, for forks).
+        """
+        return self._get(provider, "network", lambda: provider.network.chain_id)
+
+    def clear(self):
+        self._state = None
+
+    def _get(self, provider: "ProviderAPI", name: str, fn: Callable[[], int]) -> int:
+        network = provider.network.choice
+        state = self._state
+        if state is None or state[0]() is not provider or state[1] != network:
+            state = (weakref.ref(provider), network, {})
+            self._state = state
+
+        chain_ids = state[2]
+        if (chain_id := chain_ids.get(name)) is None:
+            chain_id = fn()
+            chain_ids[name] = chain_id
+
+        return chain_id
+
+
+_chain_ids = _ChainIDCache()
+
 
 class EtherscanQueryEngine(QueryAPI):
+    @property
+    def _chain_id(self) -> int:
+        return _chain_ids.get_chain_id(self.provider)
+
+    @property
+    def _network_chain_id(self) -> int:
+        return _chain_ids.get_network_chain_id(self.provider)
+
     @property
     def _client_factory(self) -> ClientFactory:
-        return ClientFactory(
-            EtherscanInstance(
-                ecosystem_name=self.provider.network.ecosystem.name,
-                network_name=self.provider.network.name.replace("-fork", ""),
-                uri=self.etherscan_uri,
-                api_uri=self.etherscan_api_uri,
-            )
+        return get_client_factory(
+            self._config,
+            self.provider.network.ecosystem.name,
+            self.provider.network.name,
+            self._network_chain_id,
         )
 
     @property
@@ -33,7 +94,7 @@ class EtherscanQueryEngine(QueryAPI):
             self._config,
             self.provider.network.ecosystem.name,
             self.provider.network.name.replace("-fork", ""),
-            self.provider.network.chain_id,
+            self._network_chain_id,
         )
 
     @property
@@ -42,7 +103,7 @@ class EtherscanQueryEngine(QueryAPI):
             self._config,
             self.provider.network.ecosystem.name,
             self.provider.network.name.replace("-fork", ""),
-            self.provider.network.chain_id,
+            self._network_chain_id,
         )
 
     @singledispatchmethod
@@ -90,50 +151,102 @@ class EtherscanQueryEngine(QueryAPI):
     @perform_query.register
     def get_account_transactions(self, query: AccountTransactionQuery) -> Iterator[ReceiptAPI]:
         client = self._client_factory.get_account_client(query.account)
-        chain_id = self.provider.chain_id  # TODO: Cache this somehow [APE-635]
-        for receipt_data in client.get_all_normal_transactions():
-            if "confirmations" in receipt_data:
-                receipt_data["required_confirmations"] = receipt_data.pop("confirmations")
-            if "txreceipt_status" in receipt_data:
-                # NOTE: Etherscan uses `""` for `0` in the receipt status.
-                status = receipt_data.pop("txreceipt_status") or 0
-                receipt_data["status"] = status
-
-            if receipt_data.get("nonce") == "":
-                receipt_data["nonce"] = None
-
-            receipt_data["from"] = self.provider.network.ecosystem.decode_address(
-                receipt_data["from"]
-            )
-            receipt_data["chainId"] = chain_id
+        chain_id = self._chain_id
+        start_block, end_block = nonce_index.get_block_range(
+            chain_id, query.account, query.start_nonce, query.stop_nonce
+        )
+        if start_block is None and self._is_recent_nonce_range(query):
+            # Walk back from the latest transactions and stop at the start nonce.
+            receipts = []
+            for receipt in self._get_account_receipts(
+                client, query.account, chain_id, start_block, end_block, sort="desc"
+            ):
+                nonce = receipt.transaction.nonce or 0
+                if nonce > query.stop_nonce:
+                    continue
+                elif nonce < query.start_nonce:
+                    break
+
+                receipts.append(receipt)
+                if nonce == query.start_nonce:
+                    break
+
+            yield from reversed(receipts)
+            return
 
-            receipt = self.provider.network.ecosystem.decode_receipt(receipt_data)
+        for receipt in self._get_account_receipts(
+            client, query.account, chain_id, start_block, end_block
+        ):
+            nonce = receipt.transaction.nonce or 0
+            if nonce < query.start_nonce:
+                continue
+            elif nonce > query.stop_nonce:
+                break
 
-            # NOTE: Required for `elif` leg to function
-            if receipt.sender != query.account:
-                # Likely ``query.account`` is a contract.
+            yield receipt
+            if nonce == query.stop_nonce:
+                break
+
+    def _is_recent_nonce_range(self, query: AccountTransactionQuery) -> bool:
+        # When the nonces are closer to the account's latest nonce than to 0,
+        # it's cheaper to read the history from the end.
+        if query.start_nonce == 0:
+            return False
+
+        try:
+            nonce = self.provider.get_nonce(query.account)
+        except ApeException:
+            return False
+
+        return query.start_nonce > nonce // 2
+
+    def _get_account_receipts(
+        self,
+        client: AccountClient,
+        account: "AddressType",
+        chain_id: int,
+        start_block: Optional[int],
+        end_block: Optional[int],
+        sort: str = "asc",
+    ) -> Iterator[ReceiptAPI]:
+        ecosystem = self.provider.network.ecosystem
+        decode_receipt = ecosystem.decode_receipt
+        # NOTE: An account's transactions mostly share a few addresses,
+        #   so only checksum each of them once.
+        decode_address = lru_cache(maxsize=1024)(ecosystem.decode_address)
+        history = self.chain_manager.history
+        for transaction in client.get_all_normal_transactions(
+            start_block=start_block, end_block=end_block, sort=sort
+        ):
+            receipt_data = transaction.to_receipt_data()
+            receipt_data["from"] = decode_address(receipt_data["from"])
+            if receipt_data.get("to"):
+                receipt_data["to"] = decode_address(receipt_data["to"])
+
+            receipt_data["chainId"] = chain_id
+            receipt = decode_receipt(receipt_data)
+
+            # NOTE: Read from the transaction, as the receipt
+            #   only forwards `sender` through a slow attribute lookup.
+            txn = receipt.transaction
+            if txn.sender != account:
+                # Likely ``account`` is a contract.
                 # Cache the receipts by their sender instead and skip them here.
-                self.chain_manager.history.append(receipt)
+                history.append(receipt)
 
-            elif (
-                receipt.transaction.nonce is not None  # Just for mypy
-                # TODO: Take advantage of nonces somehow to remove this if statement
-                and query.start_nonce <= receipt.transaction.nonce <= query.stop_nonce
-            ):
+            elif txn.nonce is not None:
+                nonce_index.add(chain_id, account, txn.nonce, receipt.block_number)
                 yield receipt
 
     @perform_query.register
     def get_contract_creation_receipt(
         self, query: ContractCreationQuery
     ) -> Iterator[ContractCreation]:
-        client = self._client_factory.get_contract_client(query.contract)
-        creation_data_list = client.get_creation_data()
-        if len(creation_data_list) == 0:
+        # NOTE: Lookups made around the same time share requests.
+        batcher = self._client_factory.creation_data_batcher
+        if (creation_data := batcher.get(query.contract)) is None:
             return
-        elif len(creation_data_list) != 1:
-            raise ValueError("Expecting single creation data.")
 
-        creation_data = creation_data_list[0]
         if creation_data.blockNumber is None:
             # Server has an older API implementation.
             # Have to look-up.
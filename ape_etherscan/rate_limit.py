@@ -0,0 +1,193 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Optional
+
+from ape.logging import logger
+
+from ape_etherscan.utils import ETHERSCAN_API_KEY_NAME
+
+
+class TokenBucket:
+    """
+    A thread-safe token-bucket rate limiter.
+    The bucket holds up to ``rate`` tokens and refills at ``rate`` tokens per second,
+    so callers may burst up to the rate limit and are then spaced out evenly.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> float:
+        return self.rate
+
+    @property
+    def available(self) -> float:
+        """
+        The number of tokens left (negative when callers are waiting).
+        """
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket, going into debt when it is empty.
+
+        Args:
+            tokens (float): The number of tokens to take. Defaults to ``1``.
+
+        Returns:
+            float: The number of seconds to wait before the tokens may be used.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1):
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            tokens (float): The number of tokens to take. Defaults to ``1``.
+        """
+        if time_to_sleep := self.reserve(tokens):
+            logger.debug(f"Sleeping {time_to_sleep} seconds to avoid rate limit")
+            time.sleep(time_to_sleep)
+
+    async def acquire_async(self, tokens: float = 1):
+        """
+        Take tokens from the bucket, without blocking the event loop while
+        waiting for them.
+
+        Args:
+            tokens (float): The number of tokens to take. Defaults to ``1``.
+        """
+        if time_to_sleep := self.reserve(tokens):
+            logger.debug(f"Sleeping {time_to_sleep} seconds to avoid rate limit")
+            await asyncio.sleep(time_to_sleep)
+
+    def set_rate(self, rate: float):
+        """
+        Change the rate limit, keeping the tokens that are left.
+        """
+        with self._lock:
+            self._refill()
+            self.rate = rate
+            self._tokens = min(self._tokens, self.capacity)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+_buckets: dict[tuple[Optional[str], str], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(api_key: Optional[str], host: str, rate_limit: float) -> TokenBucket:
+    """
+    Get the process-wide rate limiter for an API key and host, so that every
+    client using the same key shares the same budget. When the configured
+    rate limit changes, the existing limiter adopts it.
+
+    Args:
+        api_key (str | None): The API key the requests use, if any.
+        host (str): The API host.
+        rate_limit (float): Requests per second.
+
+    Returns:
+        :class:`~ape_etherscan.rate_limit.TokenBucket`
+    """
+    key = (api_key, host)
+    if bucket := _buckets.get(key):
+        if bucket.rate != rate_limit:
+            bucket.set_rate(rate_limit)
+
+        return bucket
+
+    with _buckets_lock:
+        if (bucket := _buckets.get(key)) is None:
+            bucket = TokenBucket(rate_limit)
+            _buckets[key] = bucket
+
+        return bucket
+
+
+class APIKeyPool:
+    """
+    The Etherscan API keys from the ``ETHERSCAN_API_KEY`` environment variable
+    (comma-separated). Each key has its own rate-limit budget; requests go to the
+    least-loaded key, and keys that get throttled are set aside for a while.
+    """
+
+    def __init__(self, quarantine_time: float = 30):
+        self.quarantine_time = quarantine_time
+        self._raw_keys: Optional[str] = None
+        self._keys: list[str] = []
+        self._quarantined_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def keys(self) -> list[str]:
+        """
+        The configured API keys.
+        """
+        raw_keys = os.environ.get(ETHERSCAN_API_KEY_NAME)
+        if raw_keys != self._raw_keys:
+            # NOTE: Only re-parse when the environment variable changes.
+            with self._lock:
+                self._keys = [k.strip() for k in (raw_keys or "").split(",") if k.strip()]
+                self._raw_keys = raw_keys
+
+        return self._keys
+
+    def select(self, host: str, rate_limit: float) -> Optional[str]:
+        """
+        Choose the key to use for the next request: the healthy key with the
+        most of its rate-limit budget left. When every key is quarantined,
+        the one that gets released first is used.
+
+        Args:
+            host (str): The API host.
+            rate_limit (float): Requests per second, per key.
+
+        Returns:
+            str | None: None when no keys are configured.
+        """
+        if not (keys := self.keys):
+            return None
+        elif len(keys) == 1:
+            return keys[0]
+
+        now = time.monotonic()
+        if not (healthy := [k for k in keys if self._quarantined_until.get(k, 0) <= now]):
+            return min(keys, key=lambda k: self._quarantined_until.get(k, 0))
+
+        return max(healthy, key=lambda k: get_rate_limiter(k, host, rate_limit).available)
+
+    def quarantine(self, api_key: str, duration: Optional[float] = None):
+        """
+        Stop routing requests to a key for a while, such as after it got throttled.
+
+        Args:
+            api_key (str): The key.
+            duration (float | None): Seconds to set the key aside. Defaults to
+              ``quarantine_time``.
+        """
+        duration = self.quarantine_time if duration is None else duration
+        logger.debug(f"Quarantining API key '{api_key[:4]}...' for {duration} seconds.")
+        self._quarantined_until[api_key] = time.monotonic() + duration
+
+    def is_quarantined(self, api_key: str) -> bool:
+        return self._quarantined_until.get(api_key, 0) > time.monotonic()
+
+
+api_key_pool = APIKeyPool()
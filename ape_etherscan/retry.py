@@ -0,0 +1,284 @@
+import random
+import time
+from collections.abc import Collection
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional
+
+from requests import ConnectionError, ConnectTimeout, Response, Timeout
+from urllib3.exceptions import NewConnectionError
+
+from ape_etherscan.exceptions import EtherscanTimeoutError
+
+if TYPE_CHECKING:
+    from ape_etherscan.config import EcosystemConfig
+
+# Statuses worth trying again: throttling and transient server errors.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Methods safe to send again after an unknown outcome. Others (such as the POST
+# that submits a verification) may have been acted on, so they are only sent
+# again when they were certainly not.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_MAX_RATE_LIMIT_BODY_SIZE = 1024
+
+# The shortest timeout to give a request. HTTP clients reject (or ignore) 0.
+_MIN_TIMEOUT = 0.001
+
+
+def is_rate_limited(response: Response) -> bool:
+    """
+    Check if Etherscan throttled a request, either with a 429 status or,
+    as it often does, with a 200 response saying "Max rate limit reached".
+
+    Args:
+        response (``requests.Response``): The response.
+
+    Returns:
+        bool
+    """
+    if response.status_code == 429:
+        return True
+
+    # NOTE: Those bodies are tiny, so avoid scanning actual results.
+    content = response.content
+    return (
+        isinstance(content, bytes)
+        and len(content) <= _MAX_RATE_LIMIT_BODY_SIZE
+        and b"max rate limit reached" in content.lower()
+    )
+
+
+def is_connect_error(err: Exception) -> bool:
+    """
+    Check if a request failed while connecting, before anything was sent.
+
+    Args:
+        err (Exception): The request error.
+
+    Returns:
+        bool
+    """
+    if isinstance(err, ConnectTimeout):
+        return True
+
+    # NOTE: `requests` wraps urllib3's error (in a `MaxRetryError`).
+    reason = getattr(err.args[0], "reason", None) if err.args else None
+    return isinstance(err, ConnectionError) and isinstance(reason, NewConnectionError)
+
+
+def get_retry_after(response: Response) -> Optional[float]:
+    """
+    Get the seconds to wait from the response's ``Retry-After`` header.
+
+    Args:
+        response (``requests.Response``): The response.
+
+    Returns:
+        float | None: None when the header is missing or invalid.
+    """
+    if not (value := response.headers.get("Retry-After")):
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    # Otherwise, it is an HTTP date.
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before trying a request again.
+    Waits grow exponentially (with jitter, so throttled clients do not retry
+    in lock-step), honor the server's ``Retry-After``, and stop once the
+    attempts or the total time budget run out.
+
+    Args:
+        max_attempts (int): The number of attempts, including the first.
+        base_delay (float): Seconds to wait after the first failed attempt.
+        max_delay (float): The longest wait between attempts, unless the server
+          asks for longer.
+        budget (float): The most seconds to spend on a request, including waits.
+        retry_statuses (Collection[int]): The response statuses to retry.
+        retry_errors (tuple[type[Exception], ...]): The request errors to retry.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        budget: float = 120.0,
+        retry_statuses: Collection[int] = RETRY_STATUSES,
+        retry_errors: tuple[type[Exception], ...] = (ConnectionError, Timeout),
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retry_statuses = retry_statuses
+        self.retry_errors = retry_errors
+
+    @classmethod
+    def from_config(cls, config: "EcosystemConfig") -> "RetryPolicy":
+        return cls(max_attempts=config.retries, budget=config.retry_budget)
+
+    def is_retryable(self, response: Response, method: str = "GET") -> bool:
+        """
+        Check if a response is worth trying again. Requests that are not
+        idempotent are only tried again when throttled.
+        """
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return is_rate_limited(response)
+
+        return response.status_code in self.retry_statuses or is_rate_limited(response)
+
+    def is_retryable_error(self, err: Exception, method: str = "GET") -> bool:
+        """
+        Check if a request error is worth trying again. Requests that are not
+        idempotent are only tried again when they failed to connect.
+        """
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return self.is_connect_error(err)
+
+        return isinstance(err, self.retry_errors)
+
+    def is_connect_error(self, err: Exception) -> bool:
+        """
+        Check if a request failed while connecting, before anything was sent.
+        """
+        return is_connect_error(err)
+
+    def get_error_delay(
+        self,
+        err: Exception,
+        attempt: int,
+        started: float,
+        method: str = "GET",
+        deadline: Optional["Deadline"] = None,
+    ) -> Optional[float]:
+        """
+        Get the seconds to wait before trying a failed request again.
+
+        Args:
+            err (Exception): The request error.
+            attempt (int): The (0-based) attempt that failed.
+            started (float): The ``time.monotonic()`` of the first attempt.
+            method (str): The request method.
+            deadline (:class:`~ape_etherscan.retry.Deadline` | None): The deadline
+              of the operation making the request, if any.
+
+        Raises:
+            :class:`~ape_etherscan.exceptions.EtherscanTimeoutError`: When the
+              deadline passed, or would pass before trying again.
+
+        Returns:
+            float | None: None when it is time to give up.
+        """
+        delay = self.get_delay(attempt, started) if self.is_retryable_error(err, method) else None
+        if deadline is None or deadline.timeout is None:
+            return delay
+
+        elif deadline.is_expired or (delay is not None and not deadline.allows(delay)):
+            raise EtherscanTimeoutError(deadline.timeout) from err
+
+        return delay
+
+    def get_delay(
+        self,
+        attempt: int,
+        started: float,
+        response: Optional[Response] = None,
+        deadline: Optional["Deadline"] = None,
+    ) -> Optional[float]:
+        """
+        Get the seconds to wait before trying again.
+
+        Args:
+            attempt (int): The (0-based) attempt that failed.
+            started (float): The ``time.monotonic()`` of the first attempt.
+            response (``requests.Response`` | None): The response, if any.
+            deadline (:class:`~ape_etherscan.retry.Deadline` | None): The deadline
+              of the operation making the request, if any.
+
+        Returns:
+            float | None: None when it is time to give up.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        if response is None or (delay := get_retry_after(response)) is None:
+            ceiling = min(self.max_delay, self.base_delay * 2**attempt)
+            delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+
+        if time.monotonic() - started + delay > self.budget:
+            return None
+
+        elif deadline is not None and not deadline.allows(delay):
+            return None
+
+        return delay
+
+
+class Deadline:
+    """
+    The time an operation, such as paginating through an account's transactions
+    or waiting for a verification, must finish by, across all of its requests.
+
+    Args:
+        timeout (float | None): Seconds from now. ``None`` for no deadline.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+        self.expires_at = None if timeout is None else time.monotonic() + timeout
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """
+        The seconds left, or ``None`` when there is no deadline.
+        """
+        if self.expires_at is None:
+            return None
+
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def is_expired(self) -> bool:
+        """
+        Whether the deadline has passed.
+        """
+        return self.timeout is not None and self.remaining == 0
+
+    def allows(self, seconds: float) -> bool:
+        """
+        Check if there is time left to wait the given seconds.
+        """
+        return (remaining := self.remaining) is None or seconds < remaining
+
+    def check(self):
+        """
+        Raise if the deadline has passed.
+
+        Raises:
+            :class:`~ape_etherscan.exceptions.EtherscanTimeoutError`
+        """
+        if self.is_expired:
+            raise EtherscanTimeoutError(self.timeout)
+
+    def clamp(self, seconds: float) -> float:
+        """
+        Shorten a timeout so it does not go past the deadline (but not to ``0``).
+        """
+        if (remaining := self.remaining) is None:
+            return seconds
+
+        return max(min(seconds, remaining), _MIN_TIMEOUT)
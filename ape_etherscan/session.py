@@ -0,0 +1,86 @@
+import threading
+from typing import TYPE_CHECKING
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from ape_etherscan.config import EcosystemConfig
+
+
+class SessionPool:
+    """
+    The HTTP sessions of the API clients, one per API host (and connection
+    settings), so requests to a host reuse connections instead of repeating
+    the TLS handshake, and requests to different hosts do not compete for the
+    same connection pool. ``requests.Session`` is not thread-safe, so each
+    thread gets its own session, all mounting the host's one adapter (and so
+    sharing its connection pool).
+    """
+
+    def __init__(self):
+        self._adapters: dict[tuple, HTTPAdapter] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def get(self, host: str, config: "EcosystemConfig") -> Session:
+        """
+        Get the current thread's session for an API host.
+
+        Args:
+            host (str): The API host.
+            config (:class:`~ape_etherscan.config.EcosystemConfig`): The connection settings.
+
+        Returns:
+            ``requests.Session``
+        """
+        key = (host, config.pool_connections, config.pool_maxsize, config.keep_alive)
+        sessions: dict[tuple, tuple[HTTPAdapter, Session]] = self._local.__dict__.setdefault(
+            "sessions", {}
+        )
+        adapter = self._get_adapter(key, config)
+        if (entry := sessions.get(key)) and entry[0] is adapter:
+            return entry[1]
+
+        # NOTE: New thread, or the pool was closed since.
+        session = self._create_session(adapter, config)
+        sessions[key] = (adapter, session)
+        return session
+
+    def close(self):
+        """
+        Close all the connections. Sessions got before are replaced on the next
+        :meth:`get`.
+        """
+        with self._lock:
+            adapters = list(self._adapters.values())
+            self._adapters = {}
+
+        for adapter in adapters:
+            adapter.close()
+
+    def _get_adapter(self, key: tuple, config: "EcosystemConfig") -> HTTPAdapter:
+        if adapter := self._adapters.get(key):
+            return adapter
+
+        with self._lock:
+            if (adapter := self._adapters.get(key)) is None:
+                adapter = HTTPAdapter(
+                    pool_connections=config.pool_connections, pool_maxsize=config.pool_maxsize
+                )
+                self._adapters[key] = adapter
+
+            return adapter
+
+    @staticmethod
+    def _create_session(adapter: HTTPAdapter, config: "EcosystemConfig") -> Session:
+        session = Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not config.keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+
+session_pool = SessionPool()
@@ -1,13 +1,15 @@
 import json
-import re
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
-from typing import Optional, Union
+from operator import itemgetter
+from typing import Any, Optional, Union
 
 from ape.utils import cached_property
 from ethpm_types import BaseModel
-from pydantic import Field, field_validator
+from pydantic import Field, SerializationInfo, field_validator, model_serializer
 
 from ape_etherscan.exceptions import EtherscanResponseError, get_request_error
+from ape_etherscan.utils import normalize_source_code, parse_json
 
 
 @dataclass
@@ -18,12 +20,36 @@ class EtherscanInstance:
     network_name: str  # normalized (e.g. no -fork)
     uri: str
     api_uri: str
+    chain_id: Optional[int] = None
+
+
+@dataclass
+class SupportedChain:
+    """A chain from Etherscan's chainlist"""
+
+    chain_id: int
+    name: str
+    uri: str  # The block explorer
+    api_uri: str
+    data: dict  # The raw chainlist entry
+
+    @classmethod
+    def from_chainlist_entry(cls, data: dict) -> "SupportedChain":
+        return cls(
+            chain_id=int(data["chainid"]),
+            name=data.get("chainname", ""),
+            uri=data.get("blockexplorer", ""),
+            api_uri=data.get("apiurl", ""),
+            data=data,
+        )
 
 
 class SourceCodeResponse(BaseModel):
-    abi: list = Field(default=[], alias="ABI")
+    # NOTE: The ABI and source code are kept as received and only decoded
+    #   when accessed, as most lookups need one or the other (or neither).
+    raw_abi: str = Field(default="[]", alias="ABI")
     name: str = Field(default="unknown", alias="ContractName")
-    source_code: str = Field(default="", alias="SourceCode")
+    raw_source_code: str = Field(default="", alias="SourceCode")
     compiler_version: str = Field(default="", alias="CompilerVersion")
     optimization_used: bool = Field(default=True, alias="OptimizationUsed")
     optimization_runs: int = Field(default=200, alias="Runs")
@@ -39,25 +65,43 @@ class SourceCodeResponse(BaseModel):
     def validate_bools(cls, value):
         return bool(int(value))
 
-    @field_validator("abi", mode="before")
+    @field_validator("raw_abi", mode="before")
     @classmethod
     def validate_abi(cls, value):
-        return json.loads(value)
+        # NOTE: Dumps hold the parsed ABI.
+        return value if isinstance(value, str) else json.dumps(value)
 
-    @field_validator("source_code", mode="before")
-    @classmethod
-    def validate_source_code(cls, value):
-        if value.startswith("{"):
-            # NOTE: Have to deal with very poor JSON
-            # response from Etherscan.
-            fixed = re.sub(r"\r\n\s*", "", value)
-            fixed = re.sub(r"\r\n\s*", "", fixed)
-            if fixed.startswith("{{"):
-                fixed = fixed[1:-1]
+    @model_serializer(mode="wrap")
+    def serialize(self, handler, info: SerializationInfo) -> dict:
+        # NOTE: Dump the decoded ABI and source code, as they were before
+        #   decoding them lazily, under the same keys.
+        keys = {}
+        for field, name in (("raw_abi", "abi"), ("raw_source_code", "source_code")):
+            alias = self.model_fields[field].alias
+            keys[(alias or field) if info.by_alias else field] = name
 
-            return fixed
+        result = {}
+        for key, value in handler(self).items():
+            if decoded := keys.get(key):
+                result[key if info.by_alias else decoded] = getattr(self, decoded)
+            else:
+                result[key] = value
 
-        return value
+        return result
+
+    @cached_property
+    def abi(self) -> list:
+        """
+        The contract's ABI, parsed on first access.
+        """
+        return parse_json(self.raw_abi)
+
+    @cached_property
+    def source_code(self) -> str:
+        """
+        The contract's source code, fixed up on first access.
+        """
+        return normalize_source_code(self.raw_source_code)
 
 
 class ContractCreationResponse(BaseModel):
@@ -72,6 +116,233 @@ class ContractCreationResponse(BaseModel):
     creationBytecode: Optional[str] = None
 
 
+# The fields of a ``txlist`` result, in the order Etherscan sends them.
+_TRANSACTION_FIELDS = (
+    "blockNumber",
+    "timeStamp",
+    "hash",
+    "nonce",
+    "blockHash",
+    "transactionIndex",
+    "from",
+    "to",
+    "value",
+    "gas",
+    "gasPrice",
+    "isError",
+    "txreceipt_status",
+    "input",
+    "contractAddress",
+    "cumulativeGasUsed",
+    "gasUsed",
+    "confirmations",
+    "methodId",
+    "functionName",
+)
+_TRANSACTION_FIELD_INDEX = {name: index for index, name in enumerate(_TRANSACTION_FIELDS)}
+_get_transaction_fields = itemgetter(*_TRANSACTION_FIELDS)
+_RECEIPT_DATA_KEYS = tuple(
+    {"confirmations": "required_confirmations", "txreceipt_status": "status"}.get(name, name)
+    for name in _TRANSACTION_FIELDS
+)
+# NOTE: Given as ints, ape skips converting these (its slowest part of decoding).
+_RECEIPT_INT_KEYS = (
+    "blockNumber",
+    "timeStamp",
+    "nonce",
+    "transactionIndex",
+    "value",
+    "gas",
+    "gasPrice",
+    "status",
+    "cumulativeGasUsed",
+    "gasUsed",
+    "required_confirmations",
+)
+_MISSING = object()
+
+# NOTE: Values that repeat across an account's transactions (such as its own
+#   address) are stored once, instead of once per transaction.
+_SHARED_FIELD_INDICES = tuple(
+    _TRANSACTION_FIELD_INDEX[name]
+    for name in (
+        "from",
+        "to",
+        "value",
+        "gas",
+        "isError",
+        "txreceipt_status",
+        "contractAddress",
+        "methodId",
+        "functionName",
+    )
+)
+_MAX_SHARED_VALUES = 4096
+_shared_values: dict[str, str] = {}
+
+
+class EtherscanTransaction(Mapping[str, Any]):
+    """
+    A transaction from Etherscan's ``txlist``. It is read like the ``dict``
+    Etherscan sends, but it keeps the values in a tuple and stores values that
+    repeat between transactions once, so long account histories take about
+    half the memory. Numeric fields are only converted when accessed.
+
+    Args:
+        data (Mapping[str, Any]): The transaction, as Etherscan sends it.
+    """
+
+    __slots__ = ("_values", "_extra")
+
+    def __init__(self, data: Mapping[str, Any]):
+        try:
+            values = list(_get_transaction_fields(data))
+        except KeyError:
+            values = [data.get(name, _MISSING) for name in _TRANSACTION_FIELDS]
+
+        if len(_shared_values) > _MAX_SHARED_VALUES:
+            _shared_values.clear()
+
+        for index in _SHARED_FIELD_INDICES:
+            if isinstance(value := values[index], str):
+                values[index] = _shared_values.setdefault(value, value)
+
+        self._values = tuple(values)
+        self._extra: Optional[dict] = None
+        if len(data) != len(values) - values.count(_MISSING):
+            # NOTE: Keep fields Etherscan may add later.
+            self._extra = {k: v for k, v in data.items() if k not in _TRANSACTION_FIELD_INDEX}
+
+    def __getitem__(self, key: str) -> Any:
+        if (index := _TRANSACTION_FIELD_INDEX.get(key)) is not None:
+            if (value := self._values[index]) is not _MISSING:
+                return value
+
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for name, value in zip(_TRANSACTION_FIELDS, self._values):
+            if value is not _MISSING:
+                yield name
+
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(self._values) - self._values.count(_MISSING) + len(self._extra or ())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+    @staticmethod
+    def get_columns(transactions: Sequence["EtherscanTransaction"]) -> dict[str, tuple]:
+        """
+        Get the values of each field of many transactions at once.
+
+        Args:
+            transactions (Sequence[:class:`~ape_etherscan.types.EtherscanTransaction`]):
+              The transactions.
+
+        Returns:
+            dict[str, tuple]: The values by field. Missing values are ``None``.
+        """
+        columns = {}
+        for name, column in zip(_TRANSACTION_FIELDS, zip(*[tx._values for tx in transactions])):
+            if _MISSING in column:
+                column = tuple([None if value is _MISSING else value for value in column])
+
+            columns[name] = column
+
+        return columns
+
+    def _get_int(self, key: str) -> Optional[int]:
+        value = self.get(key)
+        return None if value is None or value == "" else int(value)
+
+    @property
+    def block_number(self) -> Optional[int]:
+        return self._get_int("blockNumber")
+
+    @property
+    def timestamp(self) -> Optional[int]:
+        return self._get_int("timeStamp")
+
+    @property
+    def nonce(self) -> Optional[int]:
+        return self._get_int("nonce")
+
+    @property
+    def transaction_index(self) -> Optional[int]:
+        return self._get_int("transactionIndex")
+
+    @property
+    def value(self) -> Optional[int]:
+        return self._get_int("value")
+
+    @property
+    def gas_limit(self) -> Optional[int]:
+        return self._get_int("gas")
+
+    @property
+    def gas_price(self) -> Optional[int]:
+        return self._get_int("gasPrice")
+
+    @property
+    def gas_used(self) -> Optional[int]:
+        return self._get_int("gasUsed")
+
+    def to_dict(self) -> dict:
+        """
+        The transaction as Etherscan sent it.
+        """
+        if _MISSING in self._values:
+            data = {
+                name: value
+                for name, value in zip(_TRANSACTION_FIELDS, self._values)
+                if value is not _MISSING
+            }
+        else:
+            data = dict(zip(_TRANSACTION_FIELDS, self._values))
+
+        if self._extra is not None:
+            data.update(self._extra)
+
+        return data
+
+    def to_receipt_data(self) -> dict:
+        """
+        The transaction as the data of an ape receipt
+        (see ``EcosystemAPI.decode_receipt()``), with numeric fields as ints.
+        """
+        if _MISSING in self._values:
+            data = {
+                key: value
+                for key, value in zip(_RECEIPT_DATA_KEYS, self._values)
+                if value is not _MISSING
+            }
+        else:
+            data = dict(zip(_RECEIPT_DATA_KEYS, self._values))
+
+        if "status" in data:
+            # NOTE: Etherscan uses `""` for `0` in the receipt status.
+            data["status"] = data["status"] or 0
+
+        if data.get("nonce") == "":
+            data["nonce"] = None
+
+        for key in _RECEIPT_INT_KEYS:
+            if isinstance(value := data.get(key), str) and value.isdigit():
+                data[key] = int(value)
+
+        if self._extra is not None:
+            data.update(self._extra)
+
+        return data
+
+
 ResponseValue = Union[list, dict, str]
 
 
@@ -84,7 +355,7 @@ class EtherscanResponse:
     @cached_property
     def value(self) -> ResponseValue:
         try:
-            response_data = self.response.json()
+            response_data = self._parse()
         except json.JSONDecodeError as err:
             # Etherscan may respond with HTML content.
             raise EtherscanResponseError(self.response, "Resource not found") from err
@@ -106,8 +377,25 @@ class EtherscanResponse:
 
             return err_msg
 
+        if not result.startswith(("{", "[")):
+            return result
+
         try:
             # Sometimes, the response is a stringified JSON object or list
-            return json.loads(result)
+            return parse_json(result)
         except json.JSONDecodeError:
             return result
+
+    def _parse(self) -> dict:
+        # NOTE: Parse the raw body once, skipping the decode to `str` and
+        #   the encoding detection of `requests.Response.json()`. Pages are
+        #   capped at 10,000 rows and kept whole by the callers, so streaming
+        #   rows (with `ijson`) would only be slower.
+        content = self.response.content
+        if isinstance(content, bytes):
+            try:
+                return parse_json(content)
+            except json.JSONDecodeError:
+                pass  # Possibly not UTF-8; let `requests` try.
+
+        return self.response.json()
@@ -1,3 +1,12 @@
+import json
+import re
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 ETHERSCAN_API_KEY_NAME = "ETHERSCAN_API_KEY"
 # TODO: (deprecated) Remove in 0.9 - Only 1 key required for v2.
 API_KEY_ENV_KEY_MAP = {
@@ -98,3 +107,74 @@ NETWORKS = {
         "sepolia",
     ],
 }
+
+
+def parse_json(value: Union[str, bytes]) -> Any:
+    """
+    Parse JSON, using the faster ``orjson`` when it is installed.
+
+    Args:
+        value (str | bytes): The JSON document.
+
+    Raises:
+        ``json.JSONDecodeError``: When the value is not valid JSON.
+
+    Returns:
+        Any
+    """
+    if orjson is None:
+        return json.loads(value)
+
+    # NOTE: `orjson.JSONDecodeError` is a `json.JSONDecodeError`.
+    return orjson.loads(value)
+
+
+# Etherscan pads standard-JSON sources with CRLFs and indentation.
+_CRLF_INDENT = re.compile(r"\r\n\s*")
+
+
+def normalize_source_code(source_code: str) -> str:
+    """
+    Fix up a standard-JSON source from Etherscan: remove the CRLFs (and
+    indentation) it is padded with and the extra pair of braces it is
+    sometimes wrapped in. Other sources are returned as-is.
+
+    Args:
+        source_code (str): The ``SourceCode`` of a ``getsourcecode`` result.
+
+    Returns:
+        str
+    """
+    if not source_code.startswith("{"):
+        return source_code
+
+    # NOTE: Looking for a single character is much faster than for "\r\n",
+    #   and most sources have no CRs at all.
+    if "\r" not in source_code:
+        return source_code[1:-1] if source_code.startswith("{{") else source_code
+
+    # Find the part to keep before removing the padding, so the source
+    # is only copied once.
+    start, end = 0, len(source_code)
+    padding = _CRLF_INDENT.match(source_code, 1)
+    if source_code.startswith("{", padding.end() if padding else 1):
+        # Wrapped in braces: drop the first and the last kept characters.
+        # A trailing run of whitespace is dropped from its first CRLF.
+        last = end - 1
+        while source_code[last].isspace():
+            last -= 1
+
+        if (trailing := source_code.find("\r\n", last + 1)) != -1:
+            end = trailing
+
+        start, end = 1, end - 1
+
+    pieces = []
+    position = start
+    for padding in _CRLF_INDENT.finditer(source_code, start, end):
+        piece_end = padding.start()
+        pieces.append(source_code[position:piece_end])
+        position = padding.end()
+
+    pieces.append(source_code[position:end])
+    return "".join(pieces)
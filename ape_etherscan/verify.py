@@ -11,8 +11,10 @@ from ethpm_types import Compiler, ContractType
 from ape_etherscan.exceptions import (
     ContractVerificationError,
     EtherscanResponseError,
+    EtherscanTimeoutError,
     IncompatibleCompilerSettingsError,
 )
+from ape_etherscan.retry import Deadline
 
 if TYPE_CHECKING:
     from ape.api import CompilerAPI
@@ -509,11 +511,18 @@ class SourceVerifier(ManagerAccessMixin):
         guid_did_exist = False
         fail_key = "Fail - "
         pass_key = "Pass - "
+        poll_interval = 3
+        deadline = Deadline(self.contract_client.verification_timeout)
+        timeout_message = "Timed out waiting for contract verification."
 
-        for iteration in range(100):
+        while True:
             try:
-                verification_update = self.contract_client.check_verify_status(guid)
+                verification_update = self.contract_client.check_verify_status(
+                    guid, deadline=deadline
+                )
                 guid_did_exist = True
+            except EtherscanTimeoutError as err:
+                raise ContractVerificationError(timeout_message) from err
             except EtherscanResponseError as err:
                 if "Resource not found" in str(err) and guid_did_exist:
                     # Sometimes, the GUID resource is gone before receiving a passing verification
@@ -532,16 +541,18 @@ class SourceVerifier(ManagerAccessMixin):
             elif verification_update == "Already Verified" or verification_update.startswith(
                 pass_key
             ):
+                # NOTE: Drop the cached "not verified" result, so the source is fetched again.
+                self.contract_client.forget_source_code()
                 uri = explorer.get_address_url(self.address)
                 logger.success(f"Contract verification successful!\n{uri}#code")
                 break
 
             status_message = f"Contract verification status: {verification_update}"
             logger.info(status_message)
-            time.sleep(3)
+            if not deadline.allows(poll_interval):
+                raise ContractVerificationError(timeout_message)
 
-        else:
-            raise ContractVerificationError("Timed out waiting for contract verification.")
+            time.sleep(poll_interval)
 
 
 def extract_constructor_arguments(deployment_bytecode: str, runtime_bytecode: str) -> str:
@@ -20,6 +20,7 @@ extras_require = {
         "pytest-cov",  # Coverage analyzer plugin
         "hypothesis>=6.2.0,<7",  # Strategy-based fuzzer
         "pytest-mock",  # Test mocker
+        "pyarrow>=12",  # For the Parquet export tests
     ],
     "lint": [
         "black>=24.10.0,<25",  # auto-formatter and linter
@@ -39,6 +40,9 @@ extras_require = {
         "mdformat-pyproject>=0.0.2",  # Allows configuring in pyproject.toml
     ],
     "doc": ["sphinx-ape"],
+    "async": ["aiohttp>=3.10,<4"],  # For the asynchronous clients
+    "fast": ["orjson>=3.6,<4"],  # Faster parsing of large responses
+    "parquet": ["pyarrow>=12"],  # For writing transaction histories to Parquet
     "release": [  # `release` GitHub Action job uses this
         "setuptools>=75.6.0",  # Installation tool
         "setuptools-scm",  # Installation tool
@@ -57,6 +61,9 @@ extras_require = {
 # NOTE: `pip install -e .'[dev]'` to install package
 extras_require["dev"] = (
     extras_require["test"]
+    + extras_require["async"]
+    + extras_require["fast"]
+    + extras_require["parquet"]
     + extras_require["lint"]
     + extras_require["doc"]
     + extras_require["release"]
@@ -91,7 +98,7 @@ setup(
     zip_safe=False,
     keywords="ethereum",
     packages=find_packages(exclude=["tests", "tests.*"]),
-    package_data={"ape_etherscan": ["py.typed"]},
+    package_data={"ape_etherscan": ["py.typed", "chainlist.json"]},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
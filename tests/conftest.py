@@ -16,6 +16,8 @@ import pytest
 from ape_solidity._utils import OUTPUT_SELECTION
 from requests import Response
 
+from ape_etherscan import client, query, rate_limit
+from ape_etherscan.cache import nonce_index, source_code_cache
 from ape_etherscan.client import _APIClient
 from ape_etherscan.types import EtherscanResponse
 from ape_etherscan.verify import LicenseType
@@ -41,6 +43,36 @@ def clean_datafolder():
     shutil.rmtree(DATA_FOLDER, ignore_errors=True)
 
 
+@pytest.fixture(autouse=True)
+def rate_limiters():
+    # NOTE: Rate limiters are shared process-wide; start each test with a full budget.
+    rate_limit._buckets.clear()
+    rate_limit.api_key_pool._quarantined_until.clear()
+    yield rate_limit._buckets
+
+
+@pytest.fixture(autouse=True)
+def clean_nonce_index():
+    # NOTE: The index is process-wide; don't let one test's history narrow another's queries.
+    nonce_index.clear()
+    yield nonce_index
+
+
+@pytest.fixture(autouse=True)
+def clean_chain_ids():
+    # NOTE: Tests swap providers that may reuse an address.
+    query._chain_ids.clear()
+    yield query._chain_ids
+
+
+@pytest.fixture(autouse=True)
+def clean_source_code_cache():
+    # NOTE: Tests mock different responses for the same addresses.
+    source_code_cache.clear()
+    client._source_code_requests.clear()
+    yield source_code_cache
+
+
 @pytest.fixture(scope="session")
 def standard_input_json(library):
     return {
@@ -311,6 +343,7 @@ class MockEtherscanBackend:
         expected_params = self._expected_get_ct_params(address)
         throttled = self.mocker.MagicMock(spec=Response)
         throttled.status_code = 429
+        throttled.headers = {}
 
         class ThrottleMock:
             counter = 0
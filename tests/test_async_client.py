@@ -0,0 +1,190 @@
+import asyncio
+import json
+import threading
+from typing import Optional
+
+import pytest
+
+from ape_etherscan.async_client import AsyncClientFactory
+from ape_etherscan.exceptions import ContractNotVerifiedError, EtherscanTimeoutError
+from ape_etherscan.types import EtherscanInstance
+
+
+class FakeResponse:
+    charset = "utf-8"
+    reason = "OK"
+    url = "https://explorer.example.com/api"
+
+    def __init__(self, result, status: int = 200):
+        self.status = status
+        self.headers: dict = {}
+        self._content = json.dumps({"status": "1", "message": "OK", "result": result}).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def read(self) -> bytes:
+        return self._content
+
+
+class FakeSession:
+    """
+    Stands in for an ``aiohttp.ClientSession``.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests: list[dict] = []
+        self.timeouts: list = []
+
+    def request(self, method, url, params: Optional[list] = None, timeout=None, **kwargs):
+        query = dict(params or [])
+        self.requests.append(query)
+        self.timeouts.append(timeout)
+        return self.handler(query)
+
+
+@pytest.fixture
+def instance():
+    return EtherscanInstance(
+        ecosystem_name="ethereum",
+        network_name="mainnet",
+        uri="https://explorer.example.com",
+        api_uri="https://explorer.example.com/api",
+        chain_id=1,
+    )
+
+
+def test_get_source_code(instance):
+    address = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    session = FakeSession(lambda q: FakeResponse([{"ABI": "[]", "ContractName": "MyContract"}]))
+    client = AsyncClientFactory(instance, session=session).get_contract_client(address)
+    actual = asyncio.run(client.get_source_code())
+    assert actual.name == "MyContract"
+    assert session.requests[0]["action"] == "getsourcecode"
+    assert session.requests[0]["address"] == address
+
+
+def test_get_source_code_cache_off_event_loop(mocker, instance):
+    threads = []
+
+    def record_thread(*args):
+        threads.append(threading.get_ident())
+
+    cache = mocker.patch("ape_etherscan.async_client.source_code_cache")
+    cache.get.side_effect = record_thread
+    cache.set.side_effect = record_thread
+    session = FakeSession(lambda q: FakeResponse([{"ABI": "[]", "ContractName": "MyContract"}]))
+    client = AsyncClientFactory(instance, session=session).get_contract_client("0x01")
+
+    async def get_source_code():
+        await client.get_source_code()
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(get_source_code())
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+def test_dropped_connection_is_retried(mocker, instance):
+    aiohttp = pytest.importorskip("aiohttp")
+    mocker.patch("ape_etherscan.async_client.asyncio.sleep", mocker.AsyncMock())
+    responses = [
+        aiohttp.ServerDisconnectedError(),
+        FakeResponse([{"ABI": "[]", "ContractName": "MyContract"}]),
+    ]
+
+    def handler(query):
+        if isinstance(response := responses.pop(0), Exception):
+            raise response
+
+        return response
+
+    session = FakeSession(handler)
+    client = AsyncClientFactory(instance, session=session).get_contract_client("0x01")
+    assert asyncio.run(client.get_source_code()).name == "MyContract"
+    assert len(session.requests) == 2
+
+
+def test_get_source_code_not_verified(instance):
+    address = "0x5777d92f208679DB4b9778590Fa3CAB3aC9e2168"
+    session = FakeSession(lambda q: FakeResponse([{"ABI": "Contract source code not verified"}]))
+    client = AsyncClientFactory(instance, session=session).get_contract_client(address)
+    with pytest.raises(ContractNotVerifiedError):
+        asyncio.run(client.get_source_code())
+
+
+def test_get_all_normal_transactions(instance):
+    end_page = 6
+
+    def handler(query):
+        page = int(query["page"])
+        # Params set to `None` are not sent.
+        assert "startblock" not in query
+        return FakeResponse([] if page >= end_page else [{"page": page}, {"page": page}])
+
+    session = FakeSession(handler)
+    client = AsyncClientFactory(instance, session=session).get_account_client("0x01")
+
+    async def collect():
+        return [tx["page"] async for tx in client.get_all_normal_transactions(offset=2)]
+
+    assert asyncio.run(collect()) == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+
+    # Without a deadline, only the connect and read timeouts apply.
+    timeout = session.timeouts[0]
+    assert timeout.total is None
+    assert (timeout.sock_connect, timeout.sock_read) == (10, 60)
+
+
+def test_get_all_normal_transactions_timeout(instance):
+    session = FakeSession(lambda q: FakeResponse([{"page": q["page"]}]))
+    client = AsyncClientFactory(instance, session=session).get_account_client("0x01")
+
+    async def collect():
+        return [tx async for tx in client.get_all_normal_transactions(offset=1, timeout=0)]
+
+    with pytest.raises(EtherscanTimeoutError):
+        asyncio.run(collect())
+
+    assert not session.requests
+
+
+def test_get_all_normal_transactions_timeout_during_request(mocker, instance):
+    clock = [0.0]
+    mocker.patch("ape_etherscan.retry.time.monotonic", side_effect=lambda: clock[0])
+
+    def stall(query):
+        clock[0] += 1
+        raise asyncio.TimeoutError()
+
+    session = FakeSession(stall)
+    client = AsyncClientFactory(instance, session=session).get_account_client("0x01")
+
+    async def collect():
+        return [tx async for tx in client.get_all_normal_transactions(timeout=0.3)]
+
+    with pytest.raises(EtherscanTimeoutError):
+        asyncio.run(collect())
+
+    assert 0 < session.timeouts[0].total <= 0.3
+
+
+def test_get_creation_data(instance):
+    addresses = [f"0x{i:040X}" for i in range(1, 8)]
+
+    def handler(query):
+        result = [
+            {"contractAddress": a.lower(), "contractCreator": "0x01", "txHash": "0x02"}
+            for a in query["contractaddresses"].split(",")
+        ]
+        return FakeResponse(result)
+
+    session = FakeSession(handler)
+    factory = AsyncClientFactory(instance, session=session)
+    actual = asyncio.run(factory.get_creation_data(addresses))
+    assert [c.contractAddress for c in actual.values()] == [a.lower() for a in addresses]
+    assert len(session.requests) == 2
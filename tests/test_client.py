@@ -1,8 +1,24 @@
+import inspect
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import PropertyMock
+
 import pytest
+import requests
 from ape.utils import ManagerAccessMixin
 
-from ape_etherscan.client import AccountClient
-from ape_etherscan.types import EtherscanInstance
+from ape_etherscan.cache import ChainlistCache, TransactionCache, source_code_cache
+from ape_etherscan.client import AccountClient, ClientFactory, ContractClient, get_client_factory
+from ape_etherscan.config import EcosystemConfig, EtherscanConfig
+from ape_etherscan.exceptions import (
+    ContractNotVerifiedError,
+    EtherscanTimeoutError,
+    EtherscanTooManyRequestsError,
+)
+from ape_etherscan.rate_limit import TokenBucket, api_key_pool
+from ape_etherscan.types import EtherscanInstance, EtherscanTransaction
 
 
 class TestAccountClient(ManagerAccessMixin):
@@ -50,3 +66,551 @@ class TestAccountClient(ManagerAccessMixin):
         actual = [x for x in iterator]
         expected = [{"page": 1}, {"page": 2}]
         assert actual == expected
+
+    def test_get_all_normal_transactions_timeout(self, mocker, account_client):
+        # Each request takes 4 seconds.
+        clock = [0.0]
+        mocker.patch("ape_etherscan.retry.time.monotonic", side_effect=lambda: clock[0])
+
+        def get_txns(*args, **kwargs):
+            clock[0] += 4
+            resp = mocker.MagicMock()
+            resp.json.return_value = {"result": [{"page": kwargs["params"]["page"]}]}
+            return resp
+
+        account_client.session.request.side_effect = get_txns
+        iterator = account_client.get_all_normal_transactions(offset=1, concurrency=1, timeout=10)
+        with pytest.raises(EtherscanTimeoutError):
+            list(iterator)
+
+        calls = account_client.session.request.call_args_list
+        assert len(calls) == 3
+        # The connect and read timeouts never go past the deadline.
+        assert [c.kwargs["timeout"] for c in calls] == [(10, 10), (6, 6), (2, 2)]
+
+    def test_get_all_normal_transactions_timeout_during_request(self, mocker, account_client):
+        # The request stalls until the deadline.
+        clock = [0.0]
+        mocker.patch("ape_etherscan.retry.time.monotonic", side_effect=lambda: clock[0])
+
+        def stall(*args, **kwargs):
+            clock[0] += kwargs["timeout"][1]
+            raise requests.ReadTimeout()
+
+        account_client.session.request.side_effect = stall
+        with pytest.raises(EtherscanTimeoutError) as info:
+            list(account_client.get_all_normal_transactions(timeout=0.3))
+
+        assert isinstance(info.value.__cause__, requests.ReadTimeout)
+
+    def test_request_timeouts(self, mocker, account_client):
+        resp = mocker.MagicMock()
+        resp.json.return_value = {"result": []}
+        account_client.session.request.return_value = resp
+        list(account_client.get_all_normal_transactions())
+        timeout = account_client.session.request.call_args.kwargs["timeout"]
+        assert timeout == (
+            account_client._config.connect_timeout,
+            account_client._config.read_timeout,
+        )
+
+    @pytest.mark.parametrize("concurrency", (1, 3))
+    def test_get_all_normal_transactions_concurrency(self, mocker, account_client, concurrency):
+        end_page = 6
+
+        def get_txns(*args, **kwargs):
+            page = kwargs.get("params").get("page")
+            result = [] if page >= end_page else [{"page": page}, {"page": page}]
+            resp = mocker.MagicMock()
+            resp.json.return_value = {"result": result}
+            return resp
+
+        account_client.session.request.side_effect = get_txns
+        iterator = account_client.get_all_normal_transactions(offset=2, concurrency=concurrency)
+        actual = [x["page"] for x in iterator]
+        assert actual == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+
+        # Never requests more than `concurrency` pages past the last page.
+        requested = [c.kwargs["params"]["page"] for c in account_client.session.request.mock_calls]
+        assert max(requested) <= end_page + concurrency - 1
+
+    def test_get_all_normal_transactions_default_concurrency(self, mocker, account_client):
+        def get_txns(*args, **kwargs):
+            page = kwargs["params"]["page"]
+            resp = mocker.MagicMock()
+            resp.json.return_value = {"result": [] if page >= 3 else [{"page": page}]}
+            return resp
+
+        account_client.session.request.side_effect = get_txns
+        assert len(list(account_client.get_all_normal_transactions(offset=1))) == 2
+
+        # Pages are not requested ahead unless opted in.
+        requested = [c.kwargs["params"]["page"] for c in account_client.session.request.mock_calls]
+        assert requested == [1, 2, 3]
+
+    @pytest.mark.parametrize("sort", ("asc", "desc"))
+    @pytest.mark.parametrize("concurrency", (1, 3))
+    def test_get_all_normal_transactions_past_result_window(
+        self, mocker, account_client, sort, concurrency
+    ):
+        # 3 transactions per block, in blocks 0 to 19.
+        history = [
+            {"blockNumber": str(block), "hash": f"0x{block:02}{i}"}
+            for block in range(20)
+            for i in range(3)
+        ]
+        mocker.patch("ape_etherscan.client.MAX_RESULT_WINDOW", 8)
+
+        def get_txns(*args, **kwargs):
+            params = kwargs["params"]
+            page, offset = params["page"], params["offset"]
+            assert page * offset <= 8, "Exceeded result window"
+            start, end = params["startblock"], params["endblock"]
+            txns = [
+                tx
+                for tx in history
+                if (start is None or int(tx["blockNumber"]) >= start)
+                and (end is None or int(tx["blockNumber"]) <= end)
+            ]
+            if params["sort"] == "desc":
+                txns.reverse()
+
+            resp = mocker.MagicMock()
+            first = (page - 1) * offset
+            resp.json.return_value = {"result": txns[first:][:offset]}
+            return resp
+
+        account_client.session.request.side_effect = get_txns
+        iterator = account_client.get_all_normal_transactions(
+            start_block=0, end_block=19, offset=2, sort=sort, concurrency=concurrency
+        )
+        expected = history if sort == "asc" else history[::-1]
+        assert list(iterator) == expected
+
+    def test_get_all_normal_transactions_many_result_windows(self, mocker, account_client):
+        # A transaction per block; each window of 2 only gets 1 new transaction.
+        history = [{"blockNumber": str(block), "hash": f"0x{block:04}"} for block in range(1000)]
+        mocker.patch("ape_etherscan.client.MAX_RESULT_WINDOW", 2)
+        stack_depths = set()
+
+        def get_page(page, start_block, end_block, offset, sort, deadline):
+            stack_depths.add(len(inspect.stack(0)))
+            first = (start_block or 0) + (page - 1) * offset
+            return [EtherscanTransaction(tx) for tx in history[first:][:offset]]
+
+        mocker.patch.object(account_client, "_get_page_of_normal_transactions", get_page)
+        iterator = account_client.get_all_normal_transactions(offset=1, concurrency=1)
+        assert list(iterator) == history
+        # The stack does not grow with the number of windows.
+        assert len(stack_depths) == 1
+
+    def test_get_all_normal_transactions_past_result_window_stops_early(
+        self, mocker, account_client
+    ):
+        history = [{"blockNumber": str(block), "hash": f"0x{block:04}"} for block in range(400)]
+        mocker.patch("ape_etherscan.client.MAX_RESULT_WINDOW", 4)
+        requests_made = []
+
+        def get_page(page, start_block, end_block, offset, sort, deadline):
+            requests_made.append((start_block, page))
+            time.sleep(0.001)
+            txns = [tx for tx in history if start_block <= int(tx["blockNumber"]) <= end_block]
+            first = (page - 1) * offset
+            return [EtherscanTransaction(tx) for tx in txns[first:][:offset]]
+
+        mocker.patch.object(account_client, "_get_page_of_normal_transactions", get_page)
+        iterator = account_client.get_all_normal_transactions(
+            start_block=0, end_block=399, offset=2, concurrency=4
+        )
+        assert [next(iterator)["hash"] for _ in range(6)] == [tx["hash"] for tx in history[:6]]
+        iterator.close()
+
+        # The ranges fetched ahead stop after their current page.
+        time.sleep(0.1)
+        count = len(requests_made)
+        time.sleep(0.1)
+        assert len(requests_made) == count
+        assert count < 20
+
+    def test_get_all_normal_transactions_cached(
+        self, mocker, tmp_path, instance, address, mock_session
+    ):
+        mocker.patch.object(
+            TransactionCache,
+            "path",
+            new_callable=PropertyMock,
+            return_value=tmp_path / "transactions.db",
+        )
+        instance.chain_id = 1
+        account_client = AccountClient(instance, address.address)
+        account_client.session = mock_session
+        account_client._config = EcosystemConfig(cache_transactions=True)
+        # 2 transactions per block, in blocks 0 to 9.
+        history = [
+            {"blockNumber": str(block), "transactionIndex": str(i), "hash": f"0x{block}{i}"}
+            for block in range(10)
+            for i in range(2)
+        ]
+        head = 5
+
+        def get_txns(*args, **kwargs):
+            start = kwargs["params"]["startblock"] or 0
+            txns = [tx for tx in history if start <= int(tx["blockNumber"]) <= head]
+            resp = mocker.MagicMock()
+            resp.json.return_value = {"result": txns if kwargs["params"]["page"] == 1 else []}
+            return resp
+
+        account_client.session.request.side_effect = get_txns
+        fn = account_client.get_all_normal_transactions
+        assert list(fn(start_block=2, end_block=4)) == history[4:10]
+        assert account_client.session.request.call_args.kwargs["params"]["startblock"] is None
+
+        # Only the blocks after the last one stored are requested.
+        head = 9
+        assert list(fn(sort="desc")) == history[::-1]
+        assert account_client.session.request.call_args.kwargs["params"]["startblock"] == 6
+
+        # Nothing to request when the range is already stored.
+        account_client.session.request.reset_mock()
+        assert list(fn(end_block=0)) == history[:2]
+        assert not account_client.session.request.called
+
+    def test_throttled_key_is_quarantined(self, mocker, monkeypatch, account_client):
+        monkeypatch.setenv("ETHERSCAN_API_KEY", "key0,key1")
+        throttled = mocker.MagicMock(status_code=429)
+        success = mocker.MagicMock(status_code=200)
+        success.json.return_value = {"result": []}
+        account_client.session.request.side_effect = [throttled, success]
+        mocker.patch("ape_etherscan.client.time.sleep")
+
+        account_client._get_page_of_normal_transactions(1)
+        calls = account_client.session.request.call_args_list
+        used_keys = [c.kwargs["params"]["apikey"] for c in calls]
+        assert used_keys == ["key0", "key1"]
+        assert api_key_pool.is_quarantined("key0")
+
+    def test_server_error_is_retried(self, mocker, account_client):
+        failed = mocker.MagicMock(status_code=503, headers={})
+        success = mocker.MagicMock(status_code=200)
+        success.json.return_value = {"result": []}
+        account_client.session.request.side_effect = [failed, success]
+        sleep = mocker.patch("ape_etherscan.client.time.sleep")
+
+        account_client._get_page_of_normal_transactions(1)
+        assert account_client.session.request.call_count == 2
+        assert sleep.call_count == 1
+
+    def test_post_is_only_sent_again_when_not_received(self, mocker, account_client):
+        # NOTE: A POST (such as a verification) may have been acted on after a
+        #   read timeout or server error, so sending it again could duplicate it.
+        success = mocker.MagicMock(status_code=200)
+        success.json.return_value = {"result": "guid"}
+        mocker.patch("ape_etherscan.client.time.sleep")
+
+        account_client.session.request.side_effect = [requests.ReadTimeout(), success]
+        with pytest.raises(requests.ReadTimeout):
+            account_client._post({"action": "verifysourcecode"})
+
+        failed = mocker.MagicMock(status_code=503, headers={})
+        failed.raise_for_status.side_effect = requests.HTTPError()
+        account_client.session.request.side_effect = [failed, success]
+        with pytest.raises(requests.HTTPError):
+            account_client._post({"action": "verifysourcecode"})
+
+        assert account_client.session.request.call_count == 2
+
+        # It never reached the server.
+        account_client.session.request.side_effect = [requests.ConnectTimeout(), success]
+        assert account_client._post({"action": "verifysourcecode"}).value == "guid"
+        assert account_client.session.request.call_count == 4
+
+    def test_throttled_too_long(self, mocker, account_client):
+        throttled = mocker.MagicMock(status_code=429, headers={})
+        account_client.session.request.return_value = throttled
+        mocker.patch("ape_etherscan.client.time.sleep")
+
+        with pytest.raises(EtherscanTooManyRequestsError):
+            account_client._get_page_of_normal_transactions(1)
+
+        assert account_client.session.request.call_count == account_client.retry_policy.max_attempts
+
+    def test_config_uses_instance_ecosystem(self, project, address):
+        instance = EtherscanInstance(
+            ecosystem_name="polygon-zkevm",
+            network_name="mainnet",
+            uri="https://explorer.example.com",
+            api_uri="https://explorer.example.com/api",
+        )
+        with project.temp_config(etherscan={"polygon_zkevm": {"rate_limit": 7, "retries": 2}}):
+            client = AccountClient(instance, address)
+            assert client._rate_limit == 7
+            assert client._retries == 2
+
+        # Settings are resolved when the client is created.
+        assert client._rate_limit == 7
+        client.refresh_config()
+        assert client._rate_limit == 5
+
+    def test_config_when_unknown_ecosystem(self, account_client):
+        assert account_client._rate_limit == 5
+        assert account_client._retries == 5
+
+    def test_rate_limiter_shared_between_clients(
+        self, mocker, instance, account_client, rate_limiters
+    ):
+        other_client = AccountClient(instance, "0x5777d92f208679DB4b9778590Fa3CAB3aC9e2168")
+        other_client.session = account_client.session
+        response = account_client.session.request.return_value
+        response.status_code = 200
+        response.json.return_value = {"status": "1", "message": "OK", "result": []}
+        acquire = mocker.spy(TokenBucket, "acquire")
+
+        account_client._get(params={"apikey": "123"})
+        other_client._get(params={"apikey": "123"})
+        account_client._get(params={"apikey": "456"})
+
+        # Both clients drew from the one bucket for the key and host.
+        buckets = [call.args[0] for call in acquire.call_args_list]
+        assert buckets[0] is buckets[1] is rate_limiters[("123", "explorer.example.com")]
+        assert buckets[2] is rate_limiters[("456", "explorer.example.com")]
+        assert len(rate_limiters) == 2
+
+
+class TestContractClient:
+    @pytest.fixture
+    def address(self):
+        return "0x274b028b03A250cA03644E6c578D81f019eE1323"
+
+    @pytest.fixture
+    def contract_client(self, mocker, address):
+        instance = EtherscanInstance(
+            ecosystem_name="ethereum",
+            network_name="mainnet",
+            uri="https://explorer.example.com",
+            api_uri="https://explorer.example.com/api",
+            chain_id=1,
+        )
+        client = ContractClient(instance, address)
+        client.session = mocker.MagicMock()
+        return client
+
+    @pytest.fixture
+    def set_result(self, mocker, contract_client):
+        def fn(**data):
+            response = mocker.MagicMock(status_code=200)
+            response.json.return_value = {"status": "1", "message": "OK", "result": [data]}
+            contract_client.session.request.return_value = response
+
+        return fn
+
+    def test_get_source_code_cached(self, contract_client, set_result):
+        set_result(ABI="[]", ContractName="MyContract", SourceCode="contract MyContract {}")
+        assert contract_client.get_source_code().name == "MyContract"
+        assert contract_client.get_source_code().name == "MyContract"
+        assert contract_client.session.request.call_count == 1
+
+    def test_get_source_code_coalesced(self, mocker, contract_client, set_result):
+        contract_client._config = EcosystemConfig(cache_source_code=False)
+        set_result(ABI="[]", ContractName="MyContract")
+        response = contract_client.session.request.return_value
+        started = threading.Event()
+
+        def slow_request(*args, **kwargs):
+            started.set()
+            time.sleep(0.1)
+            return response
+
+        contract_client.session.request.side_effect = slow_request
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(contract_client.get_source_code)
+            started.wait()
+            others = [executor.submit(contract_client.get_source_code) for _ in range(3)]
+            results = [first.result(), *(f.result() for f in others)]
+
+        # Everyone got the same (parsed) response from a single request.
+        assert all(r is results[0] for r in results)
+        assert contract_client.session.request.call_count == 1
+
+    def test_get_source_code_unverified(self, mocker, contract_client, set_result):
+        set_result(ABI="Contract source code not verified")
+        with pytest.raises(ContractNotVerifiedError):
+            contract_client.get_source_code()
+
+        # The negative result is cached for a short while only.
+        with pytest.raises(ContractNotVerifiedError):
+            contract_client.get_source_code()
+
+        assert contract_client.session.request.call_count == 1
+        now = mocker.patch("ape_etherscan.cache.time.time")
+        now.return_value = 10**10
+        set_result(ABI="[]", ContractName="MyContract")
+        assert contract_client.get_source_code().name == "MyContract"
+        assert contract_client.session.request.call_count == 2
+
+    def test_forget_source_code(self, address, contract_client, set_result):
+        set_result(ABI="Contract source code not verified")
+        with pytest.raises(ContractNotVerifiedError):
+            contract_client.get_source_code()
+
+        # Once verified, the "not verified" result is neither remembered nor cached.
+        contract_client.forget_source_code()
+        assert source_code_cache.get(1, address) is None
+        set_result(ABI="[]", ContractName="MyContract")
+        assert contract_client.get_source_code().name == "MyContract"
+        assert contract_client.session.request.call_count == 2
+
+    def test_get_source_code_proxy_expires(self, mocker, address, contract_client, set_result):
+        set_result(ABI="[]", ContractName="MyProxy", Proxy="1", Implementation=address)
+        contract_client.get_source_code()
+        assert source_code_cache.get(1, address) is not None
+
+        now = mocker.patch("ape_etherscan.cache.time.time")
+        now.return_value = 10**10
+        assert source_code_cache.get(1, address) is None
+
+
+class TestChainlistCache:
+    @pytest.fixture
+    def cache_path(self, mocker, tmp_path):
+        path = tmp_path / "chainlist.json"
+        mocker.patch.object(ChainlistCache, "path", new_callable=PropertyMock, return_value=path)
+        return path
+
+    @pytest.fixture
+    def mock_get(self, mocker):
+        return mocker.patch("ape_etherscan.cache.requests.get")
+
+    def test_get_when_no_cache_uses_snapshot(self, cache_path, mock_get):
+        mock_get.side_effect = requests.ConnectionError("offline")
+        cache = ChainlistCache()
+        actual = cache.get()
+        assert any(c["chainid"] == "1" for c in actual)
+
+    def test_get_uses_cache_file(self, cache_path, mock_get):
+        chains = [{"chainid": "1", "blockexplorer": "https://example.com", "apiurl": "api"}]
+        cache_path.write_text(json.dumps({"result": chains}))
+        cache = ChainlistCache()
+        assert cache.get() == chains
+        assert not cache.is_stale
+        assert not mock_get.called
+
+    def test_refresh(self, cache_path, mock_get):
+        chains = [{"chainid": "123", "blockexplorer": "https://example.com", "apiurl": "api"}]
+        mock_get.return_value.json.return_value = {"result": chains}
+        cache = ChainlistCache()
+        assert cache.refresh()
+        assert cache.get() == chains
+        assert json.loads(cache_path.read_text())["result"] == chains
+
+    def test_get_chain(self, cache_path, mock_get):
+        chains = [{"chainid": "1", "blockexplorer": "https://example.com", "apiurl": "api"}]
+        cache_path.write_text(json.dumps({"result": chains}))
+        cache = ChainlistCache()
+        actual = cache.get_chain(1)
+        assert actual.chain_id == 1
+        assert actual.uri == "https://example.com"
+        assert actual.api_uri == "api"
+
+    def test_get_chain_when_missing(self, cache_path, mock_get):
+        chains = [{"chainid": "1", "blockexplorer": "https://example.com", "apiurl": "api"}]
+        cache_path.write_text(json.dumps({"result": chains}))
+        mock_get.return_value.json.return_value = {"result": chains}
+        cache = ChainlistCache()
+        assert cache.get_chain(123) is None
+        assert cache.get_chain(456) is None
+        # Only refreshes on the first miss.
+        assert mock_get.call_count == 1
+
+    def test_get_chain_when_missing_from_snapshot(self, cache_path, mock_get):
+        chains = [{"chainid": "123", "blockexplorer": "https://example.com", "apiurl": "api"}]
+        mock_get.return_value.json.return_value = {"result": chains}
+        cache = ChainlistCache()
+        # Waits for the refresh of the (stale) snapshot instead of downloading it again.
+        assert cache.get_chain(123).uri == "https://example.com"
+        assert mock_get.call_count == 1
+
+    def test_get_chain_when_missing_and_refresh_is_slow(self, mocker, cache_path, mock_get):
+        mocker.patch("ape_etherscan.cache._CHAINLIST_MISS_TIMEOUT", 0.01)
+        done = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            done.wait(5)
+            raise requests.Timeout()
+
+        mock_get.side_effect = slow_get
+        cache = ChainlistCache()
+        try:
+            started = time.monotonic()
+            assert cache.get_chain(1337) is None
+            assert time.monotonic() - started < 1
+        finally:
+            done.set()
+
+
+def test_get_client_factory():
+    config = EtherscanConfig()
+    factory = get_client_factory(config, "ethereum", "mainnet-fork", 1)
+    assert factory._instance.network_name == "mainnet"
+    assert factory._instance.chain_id == 1
+    assert get_client_factory(config, "ethereum", "mainnet", 1) is factory
+
+    # Changing the config invalidates the factories.
+    new_config = EtherscanConfig.model_validate(
+        {"ethereum": {"mainnet": {"api_uri": "https://api.example.com"}}}
+    )
+    new_factory = get_client_factory(new_config, "ethereum", "mainnet", 1)
+    assert new_factory is not factory
+    assert new_factory._instance.api_uri == "https://api.example.com/"
+
+
+class TestClientFactory:
+    @pytest.fixture
+    def factory(self, mocker):
+        instance = EtherscanInstance(
+            ecosystem_name="ethereum",
+            network_name="mainnet",
+            uri="https://explorer.example.com",
+            api_uri="https://explorer.example.com/api",
+            chain_id=1,
+        )
+        session = mocker.patch.object(ContractClient, "session")
+
+        def get_creation_data(*args, **kwargs):
+            addresses = kwargs["params"]["contractaddresses"][0].split(",")
+            result = [
+                {"contractAddress": a.lower(), "contractCreator": "0x01", "txHash": "0x02"}
+                for a in addresses
+                if a != "0x0000000000000000000000000000000000000000"
+            ]
+            response = mocker.MagicMock(status_code=200)
+            response.json.return_value = {"status": "1", "message": "OK", "result": result}
+            return response
+
+        session.request.side_effect = get_creation_data
+        return ClientFactory(instance)
+
+    @pytest.fixture
+    def addresses(self):
+        return [f"0x{i:040X}" for i in range(1, 13)]
+
+    def test_get_creation_data(self, factory, addresses):
+        missing = "0x0000000000000000000000000000000000000000"
+        actual = factory.get_creation_data([*addresses, missing])
+        assert list(actual) == [*addresses, missing]
+        assert all(actual[a].contractAddress == a.lower() for a in addresses)
+        assert actual[missing] is None
+
+        # Up to 5 contracts per request.
+        calls = ContractClient.session.request.call_args_list
+        assert [len(c.kwargs["params"]["contractaddresses"][0].split(",")) for c in calls] == [
+            5,
+            5,
+            3,
+        ]
+
+    def test_creation_data_batcher(self, factory, addresses):
+        with ThreadPoolExecutor(max_workers=len(addresses)) as executor:
+            results = list(executor.map(factory.creation_data_batcher.get, addresses))
+
+        assert [r.contractAddress for r in results] == [a.lower() for a in addresses]
+        assert ContractClient.session.request.call_count < len(addresses)
@@ -0,0 +1,121 @@
+import json
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from ape_etherscan.columnar import iter_batches, to_columns, write_parquet
+from ape_etherscan.types import EtherscanTransaction
+
+from .conftest import MOCK_RESPONSES_PATH
+
+
+@pytest.fixture
+def transactions():
+    data = json.loads((MOCK_RESPONSES_PATH / "get_account_transactions.json").read_text())
+    template = data["result"][0]
+    return [
+        EtherscanTransaction(
+            {
+                **template,
+                "hash": f"0x{nonce:064x}",
+                "nonce": str(nonce),
+                "blockNumber": str(100 + nonce),
+                "value": str(10**21 * nonce),
+                "to": "" if nonce == 2 else template["to"],
+            }
+        )
+        for nonce in range(5)
+    ]
+
+
+def test_to_columns(transactions):
+    columns = to_columns(transactions)
+    assert columns["block_number"].dtype == np.uint64
+    assert columns["block_number"].tolist() == [100, 101, 102, 103, 104]
+    assert columns["nonce"].tolist() == [0, 1, 2, 3, 4]
+    assert columns["value"].tolist() == [10**21 * n for n in range(5)]
+    assert columns["is_error"].tolist() == [False] * 5
+
+    # Hashes and addresses are fixed-width bytes, keeping trailing zeros.
+    assert bytes(columns["hash"][1]) == (1).to_bytes(32, "big")
+    assert bytes(columns["sender"][0]).hex() == transactions[0]["from"][2:].lower()
+    assert bytes(columns["receiver"][2]) == bytes(20)
+    assert columns["receiver_valid"].tolist() == [True, True, False, True, True]
+    assert columns["nonce_valid"].all()
+    assert columns["function_name"][0] == transactions[0]["functionName"]
+
+
+def test_to_columns_with_transfers(transactions):
+    # Plain ETH transfers have no method ID, and contract creations no receiver.
+    transfer = EtherscanTransaction({**transactions[0], "methodId": "0x", "to": ""})
+    rows = [transactions[1], transfer, transactions[3], transfer]
+    columns = to_columns(rows)
+    assert {len(c) for c in columns.values()} == {4}
+    assert [bytes(v) for v in columns["method_id"]] == [
+        bytes.fromhex(transactions[1]["methodId"][2:]),
+        bytes(4),
+        bytes.fromhex(transactions[3]["methodId"][2:]),
+        bytes(4),
+    ]
+    assert columns["method_id_valid"].tolist() == [True, False, True, False]
+    assert bytes(columns["receiver"][1]) == bytes(20)
+    assert columns["nonce"].tolist() == [1, 0, 3, 0]
+
+
+def test_to_columns_when_missing_fields():
+    tx = EtherscanTransaction({"hash": f"0x{1:064x}", "nonce": "", "txreceipt_status": ""})
+    columns = to_columns([tx])
+    assert columns["nonce"].tolist() == [0]
+    assert columns["value"].tolist() == [None]
+    assert bytes(columns["block_hash"][0]) == bytes(32)
+
+    # Missing values are told apart from actual zeros.
+    assert columns["hash_valid"].tolist() == [True]
+    assert columns["nonce_valid"].tolist() == [False]
+    assert columns["block_hash_valid"].tolist() == [False]
+    assert columns["status_valid"].tolist() == [False]
+
+
+def test_to_columns_when_empty():
+    columns = to_columns([])
+    assert columns.keys() == to_columns([EtherscanTransaction({})]).keys()
+    assert all(len(c) == 0 for c in columns.values())
+
+
+def test_iter_batches(transactions):
+    batches = list(iter_batches(transactions, batch_size=2))
+    assert [b["nonce"].tolist() for b in batches] == [[0, 1], [2, 3], [4]]
+
+
+def test_client_does_not_import_numpy():
+    code = "import sys, ape_etherscan.client; assert 'numpy' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_write_parquet(tmp_path, transactions):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "transactions.parquet"
+    assert write_parquet(iter_batches(transactions, batch_size=2), path) == 5
+
+    table = pq.read_table(path)
+    assert table.column("nonce").to_pylist() == [0, 1, 2, 3, 4]
+    assert table.column("hash").to_pylist()[1] == (1).to_bytes(32, "big")
+    assert [int(v) for v in table.column("value").to_pylist()] == [10**21 * n for n in range(5)]
+
+
+def test_write_parquet_when_missing_values(tmp_path, transactions):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "transactions.parquet"
+    rows = [*transactions[:2], EtherscanTransaction({**transactions[2], "methodId": "0x"})]
+    rows.append(EtherscanTransaction({"hash": f"0x{3:064x}", "txreceipt_status": ""}))
+    assert write_parquet([to_columns(rows)], path) == 4
+
+    table = pq.read_table(path)
+    assert "receiver_valid" not in table.column_names
+    assert table.column("receiver").to_pylist()[2] is None
+    assert table.column("method_id").to_pylist()[2:] == [None, None]
+    assert table.column("nonce").to_pylist() == [0, 1, 2, None]
+    assert table.column("status").to_pylist()[3] is None
+    assert table.column("value").to_pylist()[3] is None
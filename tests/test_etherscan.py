@@ -180,6 +180,31 @@ def test_get_contract_type_with_rate_limiting(mock_backend, explorer, connection
     assert throttler.counter == 2  # Prove that it actually throttled.
 
 
+@pytest.mark.parametrize("max_workers", (1, 4))
+def test_get_contract_types(mocker, mock_backend, explorer, max_workers):
+    mock_backend.set_network(1)
+    verified = mock_backend.setup_mock_get_contract_type_response("get_contract_response_json")
+    not_verified = "0x5777d92f208679DB4b9778590Fa3CAB3aC9e2168"
+    error = EtherscanResponseError(None, "Bad request")
+    get_contract_type = type(explorer).get_contract_type
+
+    def fake_get_contract_type(self, address):
+        if address == not_verified:
+            return None
+        elif address == TRANSACTION:
+            raise error
+
+        return get_contract_type(self, address)
+
+    mocker.patch.object(type(explorer), "get_contract_type", fake_get_contract_type)
+    addresses = [verified.expected_address, not_verified, TRANSACTION, not_verified]
+    actual = explorer.get_contract_types(addresses, max_workers=max_workers)
+    assert list(actual) == [verified.expected_address, not_verified, TRANSACTION]
+    assert actual[verified.expected_address].name == "LOVEYOU"
+    assert actual[not_verified] is None
+    assert actual[TRANSACTION] is error
+
+
 def test_get_account_transactions(mock_backend, account):
     mock_backend.setup_mock_account_transactions_response(account.address)
     query = AccountTransactionQuery(
@@ -1,13 +1,120 @@
+import json
+
 import pytest
-from ape.api.query import ContractCreationQuery
+from ape.api.query import AccountTransactionQuery, ContractCreationQuery
 from ape.utils import ManagerAccessMixin
 
+from ape_etherscan.client import AccountClient
+from ape_etherscan.query import _ChainIDCache
+from ape_etherscan.types import EtherscanTransaction
+
+from .conftest import MOCK_RESPONSES_PATH
+
 
 @pytest.fixture
 def query_engine():
     return ManagerAccessMixin.query_manager.engines["etherscan"]
 
 
+@pytest.fixture
+def account_history(mocker, account):
+    """
+    10 transactions from the account, in blocks 100, 102, ..., 118.
+    Returns the block ranges requested and the number of transactions served.
+    """
+    template = json.loads((MOCK_RESPONSES_PATH / "get_account_transactions.json").read_text())
+    history = [
+        {
+            **template["result"][0],
+            "from": account.address,
+            "nonce": str(nonce),
+            "blockNumber": str(100 + 2 * nonce),
+            "hash": f"0x{nonce:064x}",
+        }
+        for nonce in range(10)
+    ]
+    requests: list = []
+    served = []
+
+    def get_all_normal_transactions(self, start_block=None, end_block=None, sort="asc", **kwargs):
+        requests.append((start_block, end_block, sort))
+        for tx in history if sort == "asc" else history[::-1]:
+            block = int(tx["blockNumber"])
+            if (start_block is None or block >= start_block) and (
+                end_block is None or block <= end_block
+            ):
+                served.append(tx)
+                yield EtherscanTransaction(tx)
+
+    mocker.patch.object(AccountClient, "get_all_normal_transactions", get_all_normal_transactions)
+    return requests, served
+
+
+class FakeProvider:
+    def __init__(self, network):
+        self.network = network
+        self.chain_id_requests = 0
+
+    @property
+    def chain_id(self) -> int:
+        self.chain_id_requests += 1
+        return 1
+
+
+def test_chain_id_cache(networks):
+    cache = _ChainIDCache()
+    provider = FakeProvider(networks.ethereum.mainnet)
+    assert cache.get_chain_id(provider) == 1
+    assert cache.get_chain_id(provider) == 1
+    assert cache.get_network_chain_id(provider) == 1
+    assert provider.chain_id_requests == 1
+
+    # Switching networks or providers looks up the chain ID again.
+    provider.network = networks.ethereum.sepolia
+    assert cache.get_network_chain_id(provider) == 11155111
+    assert cache.get_chain_id(provider) == 1
+    assert provider.chain_id_requests == 2
+
+    other_provider = FakeProvider(networks.ethereum.sepolia)
+    cache.get_chain_id(other_provider)
+    assert other_provider.chain_id_requests == 1
+
+
+def test_account_transaction_query_stops_at_stop_nonce(
+    mocker, query_engine, account, account_history
+):
+    requests, served = account_history
+    mocker.patch.object(type(query_engine), "_is_recent_nonce_range", return_value=False)
+
+    query = AccountTransactionQuery(
+        start_nonce=2, stop_nonce=4, columns=["*"], account=account.address
+    )
+    actual = [r.transaction.nonce for r in query_engine.perform_query(query)]
+    assert actual == [2, 3, 4]
+    assert len(served) == 5  # Didn't read the rest of the history.
+
+    # The nonces seen so far narrow the blocks of the next query.
+    query = AccountTransactionQuery(
+        start_nonce=3, stop_nonce=3, columns=["*"], account=account.address
+    )
+    actual = [r.transaction.nonce for r in query_engine.perform_query(query)]
+    assert actual == [3]
+    assert requests[-1] == (106, 106, "asc")
+
+
+def test_account_transaction_query_recent_nonces(mocker, query_engine, account, account_history):
+    requests, served = account_history
+    mocker.patch.object(type(query_engine), "_is_recent_nonce_range", return_value=True)
+
+    query = AccountTransactionQuery(
+        start_nonce=7, stop_nonce=8, columns=["*"], account=account.address
+    )
+    actual = [r.transaction.nonce for r in query_engine.perform_query(query)]
+    assert actual == [7, 8]
+    assert requests == [(None, None, "desc")]
+    assert len(served) == 3
+
+
 def test_contract_creation_metadata_query(query_engine, mock_backend):
     address = "0x388C818CA8B9251b393131C08a736A67ccB19297"
     creator = "0xDB65702A9b26f8a643a31a4c84b9392589e03D7c"
@@ -0,0 +1,70 @@
+import pytest
+
+from ape_etherscan.rate_limit import APIKeyPool, TokenBucket, get_rate_limiter
+from ape_etherscan.utils import ETHERSCAN_API_KEY_NAME
+
+
+class TestTokenBucket:
+    @pytest.fixture
+    def bucket(self):
+        return TokenBucket(5)
+
+    def test_reserve_allows_burst(self, bucket):
+        for _ in range(5):
+            assert bucket.reserve() == 0
+
+    def test_reserve_when_empty(self, bucket):
+        for _ in range(5):
+            bucket.reserve()
+
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.05)
+        # Waiting callers queue up behind each other.
+        assert bucket.reserve() == pytest.approx(0.4, abs=0.05)
+
+    def test_set_rate(self, bucket):
+        bucket.set_rate(2)
+        assert bucket.capacity == 2
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() > 0
+
+
+def test_get_rate_limiter():
+    limiter = get_rate_limiter("key0", "api.example.com", 5)
+    assert get_rate_limiter("key0", "api.example.com", 5) is limiter
+    assert get_rate_limiter("key1", "api.example.com", 5) is not limiter
+    assert get_rate_limiter("key0", "api2.example.com", 5) is not limiter
+
+    # Adopts changes to the configured rate limit.
+    assert get_rate_limiter("key0", "api.example.com", 10) is limiter
+    assert limiter.rate == 10
+
+
+class TestAPIKeyPool:
+    @pytest.fixture
+    def pool(self, monkeypatch):
+        monkeypatch.setenv(ETHERSCAN_API_KEY_NAME, "key0, key1")
+        return APIKeyPool()
+
+    def test_keys(self, pool, monkeypatch):
+        assert pool.keys == ["key0", "key1"]
+        monkeypatch.setenv(ETHERSCAN_API_KEY_NAME, "key2")
+        assert pool.keys == ["key2"]
+        monkeypatch.delenv(ETHERSCAN_API_KEY_NAME)
+        assert pool.select("api.example.com", 5) is None
+
+    def test_select_least_loaded(self, pool):
+        get_rate_limiter("key0", "api.example.com", 5).reserve(3)
+        assert pool.select("api.example.com", 5) == "key1"
+        get_rate_limiter("key1", "api.example.com", 5).reserve(4)
+        assert pool.select("api.example.com", 5) == "key0"
+
+    def test_quarantine(self, pool):
+        get_rate_limiter("key1", "api.example.com", 5).reserve(3)
+        pool.quarantine("key0")
+        assert pool.is_quarantined("key0")
+        assert pool.select("api.example.com", 5) == "key1"
+
+        # Falls back to the key released first when all are quarantined.
+        pool.quarantine("key1", duration=60)
+        assert pool.select("api.example.com", 5) == "key0"
@@ -0,0 +1,142 @@
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+from requests import Response
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from ape_etherscan.exceptions import EtherscanTimeoutError
+from ape_etherscan.retry import (
+    Deadline,
+    RetryPolicy,
+    get_retry_after,
+    is_connect_error,
+    is_rate_limited,
+)
+
+
+def make_response(status_code: int = 200, content: bytes = b"", **headers) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers)
+    return response
+
+
+def test_get_retry_after():
+    assert get_retry_after(make_response(429)) is None
+    assert get_retry_after(make_response(429, **{"Retry-After": "3"})) == 3
+    assert get_retry_after(make_response(429, **{"Retry-After": "soon"})) is None
+
+    retry_at = formatdate(time.time() + 10, usegmt=True)
+    actual = get_retry_after(make_response(429, **{"Retry-After": retry_at}))
+    assert actual is not None
+    assert 8 < actual <= 10
+
+
+def test_is_rate_limited():
+    body = b'{"status":"0","message":"NOTOK","result":"Max rate limit reached"}'
+    assert is_rate_limited(make_response(429))
+    assert is_rate_limited(make_response(200, body))
+    assert not is_rate_limited(make_response(200, b'{"status":"1","result":[]}'))
+
+
+@pytest.mark.parametrize("status_code", (429, 500, 502, 503, 504))
+def test_is_retryable(status_code):
+    policy = RetryPolicy()
+    assert policy.is_retryable(make_response(status_code))
+    assert not policy.is_retryable(make_response(404))
+
+
+def test_is_retryable_when_not_idempotent():
+    # The server may have acted on a POST, unless it throttled it.
+    policy = RetryPolicy()
+    assert policy.is_retryable(make_response(429), "POST")
+    assert not policy.is_retryable(make_response(503), "POST")
+
+
+def test_is_connect_error():
+    refused = NewConnectionError(None, "Connection refused")  # type: ignore[arg-type]
+    assert is_connect_error(requests.ConnectTimeout())
+    assert is_connect_error(requests.ConnectionError(MaxRetryError(None, "/", refused)))
+    assert not is_connect_error(requests.ConnectionError("Connection reset by peer"))
+    assert not is_connect_error(requests.ReadTimeout())
+
+
+def test_is_retryable_error():
+    policy = RetryPolicy()
+    assert policy.is_retryable_error(requests.ReadTimeout())
+    assert not policy.is_retryable_error(requests.ReadTimeout(), "POST")
+    assert policy.is_retryable_error(requests.ConnectTimeout(), "POST")
+
+
+def test_get_delay():
+    policy = RetryPolicy(max_attempts=10, base_delay=1, max_delay=4)
+    started = time.monotonic()
+    for attempt, ceiling in enumerate((1, 2, 4, 4)):
+        delay = policy.get_delay(attempt, started)
+        assert delay is not None
+        assert ceiling / 2 <= delay <= ceiling
+
+
+def test_get_delay_uses_retry_after():
+    policy = RetryPolicy(max_delay=1)
+    response = make_response(429, **{"Retry-After": "7"})
+    assert policy.get_delay(0, time.monotonic(), response) == 7
+
+
+def test_get_delay_gives_up():
+    policy = RetryPolicy(max_attempts=3, budget=10)
+    now = time.monotonic()
+    assert policy.get_delay(2, now) is None
+
+    # Waiting would exceed the time budget.
+    assert policy.get_delay(0, now - 9.8) is None
+    assert policy.get_delay(0, now, make_response(429, **{"Retry-After": "11"})) is None
+
+
+def test_get_delay_respects_deadline():
+    policy = RetryPolicy()
+    assert policy.get_delay(0, time.monotonic(), deadline=Deadline(0.1)) is None
+    assert policy.get_delay(0, time.monotonic(), deadline=Deadline(10)) is not None
+
+
+def test_deadline(mocker):
+    now = mocker.patch("ape_etherscan.retry.time.monotonic", return_value=100.0)
+    deadline = Deadline(10)
+    assert deadline.remaining == 10
+    assert deadline.allows(5)
+    assert deadline.clamp(60) == 10
+    deadline.check()
+
+    now.return_value = 110.0
+    assert not deadline.allows(1)
+    assert deadline.is_expired
+    # HTTP clients reject a timeout of 0.
+    assert 0 < deadline.clamp(60) < 0.1
+    with pytest.raises(EtherscanTimeoutError):
+        deadline.check()
+
+
+def test_get_error_delay(mocker):
+    now = mocker.patch("ape_etherscan.retry.time.monotonic", return_value=100.0)
+    policy = RetryPolicy(max_delay=1)
+    deadline = Deadline(10)
+    assert policy.get_error_delay(requests.ReadTimeout(), 0, 100.0, deadline=deadline)
+    assert policy.get_error_delay(requests.ReadTimeout(), 0, 100.0, "POST", deadline) is None
+
+    # Out of time, rather than attempts.
+    now.return_value = 110.0
+    with pytest.raises(EtherscanTimeoutError) as info:
+        policy.get_error_delay(requests.ReadTimeout(), 0, 100.0, "POST", deadline)
+
+    assert isinstance(info.value.__cause__, requests.ReadTimeout)
+
+
+def test_no_deadline():
+    deadline = Deadline()
+    assert deadline.remaining is None
+    assert deadline.allows(1_000_000)
+    assert deadline.clamp(60) == 60
+    deadline.check()
@@ -0,0 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ape_etherscan.client import ContractClient, _APIClient
+from ape_etherscan.config import EcosystemConfig
+from ape_etherscan.session import SessionPool, session_pool
+from ape_etherscan.types import EtherscanInstance
+
+
+@pytest.fixture
+def pool():
+    pool = SessionPool()
+    yield pool
+    pool.close()
+
+
+def test_get(pool):
+    config = EcosystemConfig(pool_maxsize=32)
+    session = pool.get("api.etherscan.io", config)
+    assert pool.get("api.etherscan.io", config) is session
+    assert pool.get("api.example.com", config) is not session
+
+    adapter = session.get_adapter("https://api.etherscan.io/v2/api")
+    assert adapter._pool_maxsize == 32  # type: ignore[attr-defined]
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_get_from_threads(pool):
+    config = EcosystemConfig()
+    session = pool.get("api.etherscan.io", config)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_session = executor.submit(pool.get, "api.etherscan.io", config).result()
+
+    # Each thread has its own session, but they share the connections.
+    assert other_session is not session
+    url = "https://api.etherscan.io/v2/api"
+    assert other_session.get_adapter(url) is session.get_adapter(url)
+
+
+def test_close(pool):
+    config = EcosystemConfig()
+    session = pool.get("api.etherscan.io", config)
+    pool.close()
+    other_session = pool.get("api.etherscan.io", config)
+    assert other_session is not session
+    assert pool.get("api.etherscan.io", config) is other_session
+
+
+def test_get_when_config_changes(pool):
+    session = pool.get("api.etherscan.io", EcosystemConfig())
+    other_session = pool.get("api.etherscan.io", EcosystemConfig(keep_alive=False))
+    assert other_session is not session
+    assert other_session.headers["Connection"] == "close"
+
+
+def test_client_uses_pooled_session(mocker):
+    # NOTE: Other tests may set a session on the class.
+    mocker.patch.object(_APIClient, "session", None)
+    instance = EtherscanInstance(
+        ecosystem_name="ethereum",
+        network_name="mainnet",
+        uri="https://explorer.example.com",
+        api_uri="https://api.example.com/api",
+    )
+    client = ContractClient(instance, "0x274b028b03A250cA03644E6c578D81f019eE1323")
+    assert client._get_session() is session_pool.get("api.example.com", client._config)
+
+    # A session set on the client takes precedence.
+    client.session = mocker.MagicMock()
+    assert client._get_session() is client.session
@@ -1,6 +1,17 @@
+import json
+import re
+
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from requests import Response
+
+from ape_etherscan import types
+from ape_etherscan.exceptions import EtherscanResponseError
+from ape_etherscan.types import EtherscanResponse, EtherscanTransaction, SourceCodeResponse
+from ape_etherscan.utils import normalize_source_code
 
-from ape_etherscan.types import EtherscanResponse
+from .conftest import MOCK_RESPONSES_PATH
 
 
 class TestEtherscanResponse:
@@ -13,3 +24,140 @@ class TestEtherscanResponse:
         response.json.return_value = {"result": value}
         resp = EtherscanResponse(response, "my-ecosystem", raise_on_exceptions=False)
         assert resp.value == value
+
+    @pytest.mark.parametrize(
+        "result,expected",
+        (
+            ('[{"foo": "bar"}]', [{"foo": "bar"}]),
+            ("Pending in queue", "Pending in queue"),
+            ("[not json", "[not json"),
+        ),
+    )
+    def test_value_from_content(self, result, expected):
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps({"status": "1", "result": result}).encode()
+        resp = EtherscanResponse(response, "my-ecosystem", raise_on_exceptions=False)
+        assert resp.value == expected
+
+    def test_value_when_html(self):
+        response = Response()
+        response.status_code = 404
+        response._content = b"<html>Not Found</html>"
+        resp = EtherscanResponse(response, "my-ecosystem", raise_on_exceptions=False)
+        with pytest.raises(EtherscanResponseError, match="Resource not found"):
+            _ = resp.value
+
+
+class TestSourceCodeResponse:
+    def test_abi_is_lazy(self, mocker):
+        parse = mocker.spy(types, "parse_json")
+        response = SourceCodeResponse.model_validate(
+            {"ABI": '[{"type": "fallback"}]', "ContractName": "MyContract"}
+        )
+        assert response.name == "MyContract"
+        assert not parse.called
+
+        assert response.abi == [{"type": "fallback"}]
+        assert response.abi == [{"type": "fallback"}]
+        assert parse.call_count == 1
+
+    def test_source_code(self):
+        source_code = '{{\r\n  "language": "Solidity",\r\n  "sources": {}\r\n}}'
+        response = SourceCodeResponse.model_validate({"SourceCode": source_code})
+        assert response.raw_source_code == source_code
+        assert response.source_code == '{"language": "Solidity","sources": {}}'
+
+    def test_model_dump(self):
+        source_code = '{{\r\n  "language": "Solidity"\r\n}}'
+        response = SourceCodeResponse.model_validate(
+            {"ABI": '[{"type": "fallback"}]', "SourceCode": source_code}
+        )
+
+        # Dumps hold the parsed ABI and fixed-up source code.
+        data = response.model_dump()
+        assert data["ABI"] == [{"type": "fallback"}]
+        assert data["SourceCode"] == '{"language": "Solidity"}'
+        assert "raw_abi" not in data
+        data = response.model_dump(by_alias=False)
+        assert data["abi"] == [{"type": "fallback"}]
+        assert data["source_code"] == '{"language": "Solidity"}'
+        assert "raw_source_code" not in data
+        assert SourceCodeResponse.model_validate(response.model_dump()).abi == response.abi
+
+
+class TestEtherscanTransaction:
+    @pytest.fixture
+    def data(self):
+        data = json.loads((MOCK_RESPONSES_PATH / "get_account_transactions.json").read_text())
+        tx = data["result"][0]
+        # Use the fields of a raw `txlist` result.
+        tx["confirmations"] = tx.pop("required_confirmations")
+        del tx["status"]
+        tx["txreceipt_status"] = ""
+        return tx
+
+    def test_mapping(self, data):
+        tx = EtherscanTransaction({**data, "newField": "1"})
+        assert tx == {**data, "newField": "1"}
+        assert tx["hash"] == data["hash"]
+        assert tx["newField"] == "1"
+        assert "blockHash" in tx
+        assert "missing" not in tx
+        assert tx.get("missing") is None
+        assert len(tx) == len(data) + 1
+        assert list(tx)[0] == "blockNumber"
+        with pytest.raises(KeyError):
+            _ = tx["missing"]
+
+    def test_shares_repeated_values(self, data):
+        first = EtherscanTransaction(data)
+        second = EtherscanTransaction(json.loads(json.dumps(data)))
+        assert first["from"] is second["from"]
+
+    def test_numeric_fields(self, data):
+        tx = EtherscanTransaction(data)
+        assert tx.block_number == 11291970
+        assert tx.nonce == 0
+        assert tx.gas_used == 257131
+        assert EtherscanTransaction({"nonce": ""}).nonce is None
+
+    def test_to_receipt_data(self, data):
+        tx = EtherscanTransaction(data)
+        actual = tx.to_receipt_data()
+        assert actual["required_confirmations"] == int(data["confirmations"])
+        assert actual["blockNumber"] == int(data["blockNumber"])
+        assert actual["status"] == 0
+        assert "confirmations" not in actual
+        assert "txreceipt_status" not in actual
+
+        # The transaction is left as-is.
+        assert tx == data
+
+
+def legacy_normalize_source_code(value: str) -> str:
+    # The implementation `normalize_source_code()` replaced.
+    if value.startswith("{"):
+        fixed = re.sub(r"\r\n\s*", "", value)
+        fixed = re.sub(r"\r\n\s*", "", fixed)
+        if fixed.startswith("{{"):
+            fixed = fixed[1:-1]
+
+        return fixed
+
+    return value
+
+
+@given(st.lists(st.sampled_from(["{", "}", "\r", "\n", "\r\n", " ", "\x0b", "\u00a0", "a"])))
+def test_normalize_source_code(chunks):
+    value = "".join(chunks)
+    for source_code in (value, f"{{{value}", f"{{{{{value}}}}}"):
+        assert normalize_source_code(source_code) == legacy_normalize_source_code(source_code)
+
+
+def test_normalize_source_code_from_mock():
+    source_code = (MOCK_RESPONSES_PATH / "get_contract_response_json_source_code.json").read_text()
+    source_code = source_code.replace("\n", "\r\n")
+    actual = normalize_source_code(source_code)
+    assert actual == legacy_normalize_source_code(source_code)
+    assert json.loads(actual)["language"] == "Solidity"